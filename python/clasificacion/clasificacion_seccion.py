@@ -21,111 +21,96 @@ Tipos de perfil soportados:
     Tubo Rect.    : TUBO RECT., HSS (rectangular)
 """
 
+import math
+import sys
+from functools import lru_cache
+
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    # numba es opcional: sin él los kernels se ejecutan en Python puro
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda funcion: funcion
+
 
 # ============================================================================
-# LÍMITES λp y λr  (CIRSOC 301 / AISC 360-10, Tabla B4.1)
+# TIPOS DE PERFIL POR FAMILIA
 # ============================================================================
 
-def _limites_ala_doble_t(E: float, Fy: float) -> tuple[float, float]:
-    """
-    Ala de perfil doble T.
-    Elemento voladizo (un lado desde el alma).  λ = bf / (2·tf)
-    Ref: AISC 360-10 Tabla B4.1, caso 1
-    """
-    raiz = np.sqrt(E / Fy)
-    return 0.38 * raiz, 1.00 * raiz
-
-
-def _limites_alma_doble_t(E: float, Fy: float) -> tuple[float, float]:
-    """
-    Alma de perfil doble T.
-    Elemento interior sujeto en ambos bordes.  λ = hw / tw
-    Ref: AISC 360-10 Tabla B4.1, caso 9
-    """
-    raiz = np.sqrt(E / Fy)
-    return 3.76 * raiz, 5.70 * raiz
-
-
-def _limites_ala_canal(E: float, Fy: float) -> tuple[float, float]:
-    """
-    Ala de perfil canal.
-    Voladizo desde el alma.  λ = bf / tf  (BD CIRSOC: columna bf/2tf)
-    Ref: AISC 360-10 Tabla B4.1, caso 1
-    """
-    raiz = np.sqrt(E / Fy)
-    return 0.38 * raiz, 1.00 * raiz
-
-
-def _limites_alma_canal(E: float, Fy: float) -> tuple[float, float]:
-    """
-    Alma de perfil canal.  λ = hw / tw
-    Ref: AISC 360-10 Tabla B4.1, caso 9
-    """
-    raiz = np.sqrt(E / Fy)
-    return 3.76 * raiz, 5.70 * raiz
-
-
-def _limites_pata_angular(E: float, Fy: float) -> tuple[float, float]:
-    """
-    Pata de perfil angular. Voladizo libre.  λ = b / t
-    λp conservador = 0.38·√(E/Fy).  λr = 0.45·√(E/Fy)
-    Ref: AISC 360-10 Tabla B4.1, caso 3
-    """
-    raiz = np.sqrt(E / Fy)
-    return 0.38 * raiz, 0.45 * raiz
+_TIPOS_DOBLE_T   = frozenset({'W', 'M', 'HP', 'S', 'IPE', 'IPN', 'IPB', 'IPBl', 'IPBv'})
+_TIPOS_CANAL     = frozenset({'C', 'MC', 'UPN'})
+_TIPOS_ANGULAR   = frozenset({'L'})
+_TIPOS_T         = frozenset({'T', 'WT', 'MT', 'ST'})
+_TIPOS_TUBO_CIRC = frozenset({'TUBO CIRC.', 'PIPE'})
+_TIPOS_HSS       = frozenset({'TUBO CUAD.', 'TUBO RECT.', 'HSS'})
+_TIPOS_HSS_RECT  = frozenset({'TUBO RECT.', 'HSS'})   # con web (h/t) además de flange
 
 
-def _limites_ala_perfil_t(E: float, Fy: float) -> tuple[float, float]:
-    """
-    Ala de perfil T (WT, MT, ST, T).
-    Voladizo desde el alma.  λ = bf / (2·tf)
-    Ref: AISC 360-10 Tabla B4.1a, caso 1 (compresión)
-    """
-    raiz = np.sqrt(E / Fy)
-    return 0.38 * raiz, 1.00 * raiz
-
-
-def _limites_alma_perfil_t(E: float, Fy: float) -> tuple[float, float]:
-    """
-    Alma de perfil T (stem).  λ = d / tw
-    Ref: AISC 360-10 Tabla B4.1a, caso 4
-    """
-    raiz = np.sqrt(E / Fy)
-    # Compresión: λr = 0.75·√(E/Fy) según caso 4
-    # No hay λp para stem en compresión (solo λr)
-    return None, 0.75 * raiz
-
-
-def _limites_tubo_circular(E: float, Fy: float) -> tuple[float, float]:
-    """
-    Tubo circular (PIPE, TUBO CIRC.).  λ = D / t
-    Ref: AISC 360-10 Tabla B4.1a, caso 9 (compresión)
-    """
-    raiz = np.sqrt(E / Fy)
-    # Compresión: λr = 0.11·E/Fy
-    # No hay λp para tubos circulares en compresión
-    return None, 0.11 * (E / Fy)
-
-
-def _limites_tubo_rectangular_pared(E: float, Fy: float) -> tuple[float, float]:
-    """
-    Paredes de tubo rectangular/cuadrado (HSS, TUBO CUAD., TUBO RECT.).
-    λ = b / t  (para flanges)
-    λ = h / t  (para webs)
-    Ref: AISC 360-10 Tabla B4.1a, caso 6 (compresión)
+# ============================================================================
+# LÍMITES λp y λr  (CIRSOC 301 / AISC 360-10, Tabla B4.1)
+# ============================================================================
+#
+#     λp = cp · (E/Fy)^exp      (cp = None → el elemento no tiene λp)
+#     λr = cr · (E/Fy)^exp
+#
+# exp = 0.5 para todos salvo la pared de tubo circular (λr = 0.11·E/Fy).
+#
+
+_COEFICIENTES_LIMITES = {
+    # (familia,   elemento)  :  cp     cr    exp     λ        Tabla B4.1
+    ('DOBLE_T',   'ala')     : (0.38,  1.00, 0.5),   # bf/2tf   caso 1
+    ('DOBLE_T',   'alma')    : (3.76,  5.70, 0.5),   # hw/tw    caso 9
+    ('CANAL',     'ala')     : (0.38,  1.00, 0.5),   # bf/tf    caso 1 (BD CIRSOC: columna bf/2tf)
+    ('CANAL',     'alma')    : (3.76,  5.70, 0.5),   # hw/tw    caso 9
+    ('ANGULAR',   'pata')    : (0.38,  0.45, 0.5),   # b/t      caso 3 (λp conservador = ala doble T)
+    ('PERFIL_T',  'ala')     : (0.38,  1.00, 0.5),   # bf/2tf   B4.1a caso 1
+    ('PERFIL_T',  'stem')    : (None,  0.75, 0.5),   # d/tw     B4.1a caso 4
+    ('TUBO_CIRC', 'pared')   : (None,  0.11, 1.0),   # D/t      B4.1a caso 9
+    ('HSS',       'flange')  : (None,  1.40, 0.5),   # b/t      B4.1a caso 6
+    ('HSS_RECT',  'web')     : (None,  1.40, 0.5),   # h/t      B4.1a caso 6
+}
+
+
+def _limites(familia: str, elemento: str, E: float, Fy: float) -> tuple[float, float]:
+    """(λp, λr) de un elemento para (E, Fy).  λp = None si no aplica."""
+    cp, cr, exp = _COEFICIENTES_LIMITES[familia, elemento]
+    raiz = math.sqrt(E / Fy) if exp == 0.5 else E / Fy
+    return (cp * raiz if cp is not None else None), cr * raiz
+
+
+@lru_cache(maxsize=64)
+def _limites_familia(familia: str, E: float, Fy: float) -> dict:
+    """
+    {elemento: (λp, λr)} para todos los elementos de una familia.
+
+    En la práctica E es fijo y Fy toma pocos valores: se memoriza con
+    lru_cache, así cada clasificación hace una sola consulta por familia.
     """
-    raiz = np.sqrt(E / Fy)
-    # Compresión: λr = 1.40·√(E/Fy)
-    # No hay λp para HSS en compresión
-    return None, 1.40 * raiz
+    return {
+        elemento: _limites(familia, elemento, E, Fy)
+        for fam, elemento in _COEFICIENTES_LIMITES
+        if fam == familia
+    }
 
 
 # ============================================================================
 # FACTOR Q PARA ELEMENTOS ESBELTOS (AISC 360-10 Sección E7)
 # ============================================================================
+#
+# Kernels escalares puros: se compilan con numba (modo nopython) si está
+# instalado. Con firma explícita la compilación ocurre al importar el
+# módulo (o se lee del caché en disco), no en la primera llamada.
+#
 
+_FIRMA_3 = 'float64(float64, float64, float64)'
+_FIRMA_4 = 'float64(float64, float64, float64, float64)'
+
+
+@njit(_FIRMA_3, cache=True)
 def _calcular_qs_ala_laminada(bt_ratio: float, E: float, Fy: float) -> float:
     """
     Qs para alas de perfiles laminados (rolled) - AISC E7 Ec. E7-4 a E7-6
@@ -134,46 +119,49 @@ def _calcular_qs_ala_laminada(bt_ratio: float, E: float, Fy: float) -> float:
     b/t para doble T = bf/(2tf)
     b/t para canal = bf/tf
     """
-    raiz_E_Fy = np.sqrt(E / Fy)
+    raiz_E_Fy = math.sqrt(E / Fy)
     
     if bt_ratio <= 0.56 * raiz_E_Fy:
         return 1.0
     elif bt_ratio < 1.03 * raiz_E_Fy:
-        return 1.415 - 0.74 * bt_ratio * np.sqrt(Fy / E)
+        return 1.415 - 0.74 * bt_ratio / raiz_E_Fy
     else:
         return 0.69 * E / (Fy * bt_ratio**2)
 
 
+@njit(_FIRMA_3, cache=True)
 def _calcular_qs_angular(bt_ratio: float, E: float, Fy: float) -> float:
     """
     Qs para ángulos simples - AISC E7 Ec. E7-10 a E7-12
     b/t = b/t (pata completa)
     """
-    raiz_E_Fy = np.sqrt(E / Fy)
+    raiz_E_Fy = math.sqrt(E / Fy)
     
     if bt_ratio <= 0.45 * raiz_E_Fy:
         return 1.0
     elif bt_ratio <= 0.91 * raiz_E_Fy:
-        return 1.34 - 0.76 * bt_ratio * np.sqrt(Fy / E)
+        return 1.34 - 0.76 * bt_ratio / raiz_E_Fy
     else:
         return 0.53 * E / (Fy * bt_ratio**2)
 
 
+@njit(_FIRMA_3, cache=True)
 def _calcular_qs_stem_perfil_t(dt_ratio: float, E: float, Fy: float) -> float:
     """
     Qs para stem (alma) de perfiles T - AISC E7 Ec. E7-7 a E7-9
     d/t = d/tw (altura del stem / espesor)
     """
-    raiz_E_Fy = np.sqrt(E / Fy)
+    raiz_E_Fy = math.sqrt(E / Fy)
     
     if dt_ratio <= 0.75 * raiz_E_Fy:
         return 1.0
     elif dt_ratio <= 1.03 * raiz_E_Fy:
-        return 1.908 - 1.22 * dt_ratio * np.sqrt(Fy / E)
+        return 1.908 - 1.22 * dt_ratio / raiz_E_Fy
     else:
         return 0.69 * E / (Fy * dt_ratio**2)
 
 
+@njit(_FIRMA_3, cache=True)
 def _calcular_q_tubo_circular(Dt_ratio: float, E: float, Fy: float) -> float:
     """
     Q para tubos circulares - AISC E7 Sección E7.2(c)
@@ -191,6 +179,7 @@ def _calcular_q_tubo_circular(Dt_ratio: float, E: float, Fy: float) -> float:
         return 0.038 * E / (Fy * Dt_ratio)
 
 
+@njit(_FIRMA_3, cache=True)
 def _calcular_qa_hss_pared(bt_ratio: float, E: float, Fcr: float) -> float:
     """
     Qa para paredes de HSS rectangulares/cuadrados - AISC E7 Ec. E7-16, E7-17
@@ -198,7 +187,7 @@ def _calcular_qa_hss_pared(bt_ratio: float, E: float, Fcr: float) -> float:
     
     b/t = ancho de pared / espesor
     """
-    raiz_E_f = np.sqrt(E / Fcr)
+    raiz_E_f = math.sqrt(E / Fcr)
     
     if bt_ratio < 1.40 * raiz_E_f:
         return 1.0
@@ -213,8 +202,8 @@ def _calcular_qa_hss_pared(bt_ratio: float, E: float, Fcr: float) -> float:
     return be_b
 
 
-def _calcular_qa_alma(hw_tw: float, E: float, Fcr: float, 
-                      b: float, A_total: float) -> float:
+@njit(_FIRMA_4, cache=True)
+def _calcular_qa_alma(hw_tw: float, E: float, Fcr: float, b: float) -> float:
     """
     Qa para almas de doble T y canales - AISC E7 Ec. E7-16, E7-17
     Elementos rigidizados uniformemente comprimidos
@@ -225,13 +214,12 @@ def _calcular_qa_alma(hw_tw: float, E: float, Fcr: float,
     E      : módulo de elasticidad [MPa]
     Fcr    : tensión crítica calculada con Q=1.0 [MPa]
     b      : ancho del alma (hw) [mm]
-    A_total: área total de la sección [mm²]
     
     Returns:
     --------
     Qa : factor de reducción para elemento rigidizado esbelta
     """
-    raiz_E_f = np.sqrt(E / Fcr)
+    raiz_E_f = math.sqrt(E / Fcr)
     
     # Verificar si el alma es esbelta
     if hw_tw < 1.49 * raiz_E_f:
@@ -245,16 +233,135 @@ def _calcular_qa_alma(hw_tw: float, E: float, Fcr: float,
     # Limitar be ≤ b
     be = min(be, b)
     
-    # Qa = Ae / Ag donde Ae se calcula con ancho efectivo
-    # Para simplificación: Ae ≈ A_total - (b - be) × tw
-    # Como no tenemos tw directamente, aproximamos: Qa ≈ be/b
-    Qa = be / b
-    
-    return Qa
+    # Qa = Ae / Ag donde Ae se calcula con ancho efectivo.
+    # Sin tw no se descuenta (b - be)·tw del área: se aproxima Qa ≈ be/b
+    return be / b
+
+
+# ============================================================================
+# FACTOR Q POR FAMILIA
+# ============================================================================
+#
+# Cada función recibe los elementos ya clasificados y devuelve (Qs, Qa, notas).
+#
+
+def _es_esbelto(elementos: dict, clave: str) -> bool:
+    return clave in elementos and elementos[clave]['clase'] == 'ESBELTA'
+
+
+def _factor_q_ala_alma(props, elementos, Fy, E, Fcr, etiqueta_ala):
+    """Doble T y canal: ala no rigidizada (Qs) + alma rigidizada (Qa)."""
+    sec = props['seccion']
+    Qs, Qa, notas = 1.0, 1.0, []
+
+    # Ala: elemento no rigidizado
+    if _es_esbelto(elementos, 'ala'):
+        bt_ala = sec['bf_2tf']
+        Qs = _calcular_qs_ala_laminada(bt_ala, E, Fy)
+        notas.append(f"Ala esbelta: {etiqueta_ala} = {bt_ala:.2f}, Qs = {Qs:.4f}")
+
+    # Alma: elemento rigidizado
+    if _es_esbelto(elementos, 'alma'):
+        if Fcr is None:
+            notas.append("ADVERTENCIA: Fcr no proporcionado, Qa = 1.0 (conservador)")
+        else:
+            hw_tw = sec['hw_tw']
+            hw = props['basicas']['d'] - 2 * sec['tf']
+            Qa = _calcular_qa_alma(hw_tw, E, Fcr, hw)
+            notas.append(f"Alma esbelta: hw/tw = {hw_tw:.2f}, Qa = {Qa:.4f}")
+
+    return Qs, Qa, notas
+
+
+def _factor_q_doble_t(props, elementos, Fy, E, Fcr):
+    return _factor_q_ala_alma(props, elementos, Fy, E, Fcr, 'bf/2tf')
+
+
+def _factor_q_canal(props, elementos, Fy, E, Fcr):
+    return _factor_q_ala_alma(props, elementos, Fy, E, Fcr, 'bf/tf')
+
+
+def _factor_q_angular(props, elementos, Fy, E, Fcr):
+    sec = props['seccion']
+    Qs, notas = 1.0, []
+    if _es_esbelto(elementos, 'pata'):
+        bt = sec['b_t']
+        Qs = _calcular_qs_angular(bt, E, Fy)
+        notas.append(f"Pata esbelta: b/t = {bt:.2f}, Qs = {Qs:.4f}")
+    return Qs, 1.0, notas
+
+
+def _factor_q_perfil_t(props, elementos, Fy, E, Fcr):
+    sec = props['seccion']
+    Qs, notas = 1.0, []
+
+    # Ala: elemento no rigidizado
+    if _es_esbelto(elementos, 'ala'):
+        bt_ala = sec['bf_2tf']
+        Qs = _calcular_qs_ala_laminada(bt_ala, E, Fy)
+        notas.append(f"Ala esbelta: bf/2tf = {bt_ala:.2f}, Qs = {Qs:.4f}")
+
+    # Stem (alma): elemento no rigidizado para T
+    if _es_esbelto(elementos, 'stem'):
+        dt = sec.get('d_tw', sec.get('hw_tw', 0))
+        if dt > 0:
+            Qs_stem = _calcular_qs_stem_perfil_t(dt, E, Fy)
+            Qs = min(Qs, Qs_stem)  # Tomar el menor
+            notas.append(f"Stem esbelta: d/tw = {dt:.2f}, Qs_stem = {Qs_stem:.4f}")
+
+    return Qs, 1.0, notas
+
+
+def _factor_q_tubo_circular(props, elementos, Fy, E, Fcr):
+    sec = props['seccion']
+    Qs, notas = 1.0, []
+    if _es_esbelto(elementos, 'pared'):
+        Dt = sec.get('D_t', 0)
+        if Dt > 0:
+            # Para tubos circulares, Q se calcula directamente (no Qs × Qa)
+            Qs = _calcular_q_tubo_circular(Dt, E, Fy)
+            notas.append(f"Tubo circular esbelta: D/t = {Dt:.2f}, Q = {Qs:.4f}")
+    return Qs, 1.0, notas
+
+
+def _factor_q_hss(props, elementos, Fy, E, Fcr):
+    sec = props['seccion']
+    # Para HSS, todas las paredes son elementos rigidizados
+    Qa_min, notas = 1.0, []
+
+    if _es_esbelto(elementos, 'flange') and Fcr is not None:
+        bt_flange = sec.get('b_t', 0)
+        if bt_flange > 0:
+            Qa_flange = _calcular_qa_hss_pared(bt_flange, E, Fcr)
+            Qa_min = min(Qa_min, Qa_flange)
+            notas.append(f"Flange esbelta: b/t = {bt_flange:.2f}, Qa = {Qa_flange:.4f}")
+
+    if _es_esbelto(elementos, 'web') and Fcr is not None:
+        ht_web = sec.get('h_tw', 0)
+        if ht_web > 0:
+            Qa_web = _calcular_qa_hss_pared(ht_web, E, Fcr)
+            Qa_min = min(Qa_min, Qa_web)
+            notas.append(f"Web esbelta: h/t = {ht_web:.2f}, Qa = {Qa_web:.4f}")
+
+    if Fcr is None and Qa_min < 1.0:
+        notas.append("ADVERTENCIA: Fcr no proporcionado, Qa = 1.0 (conservador)")
+        Qa_min = 1.0
+
+    return 1.0, Qa_min, notas
+
+
+_HANDLERS_Q = {
+    **dict.fromkeys(_TIPOS_DOBLE_T,   _factor_q_doble_t),
+    **dict.fromkeys(_TIPOS_CANAL,     _factor_q_canal),
+    **dict.fromkeys(_TIPOS_ANGULAR,   _factor_q_angular),
+    **dict.fromkeys(_TIPOS_T,         _factor_q_perfil_t),
+    **dict.fromkeys(_TIPOS_TUBO_CIRC, _factor_q_tubo_circular),
+    **dict.fromkeys(_TIPOS_HSS,       _factor_q_hss),
+}
 
 
 def calcular_Q(props: dict, Fy: float, E: float = 200_000,
-               Fcr: float = None) -> dict:
+               Fcr: float = None, clasificacion: dict = None) -> dict:
     """
     Calcular factor de reducción Q para secciones con elementos esbeltos.
     Según AISC 360-10 Sección E7.
@@ -269,6 +376,8 @@ def calcular_Q(props: dict, Fy: float, E: float = 200_000,
     Fy    : float — tensión de fluencia [MPa]
     E     : float — módulo de elasticidad [MPa]
     Fcr   : float — tensión crítica con Q=1.0 [MPa] (requerido para Qa)
+    clasificacion : dict, opcional — salida de clasificar_seccion() para
+                    props/Fy/E; si se omite se clasifica aquí
     
     Returns:
     --------
@@ -279,153 +388,28 @@ def calcular_Q(props: dict, Fy: float, E: float = 200_000,
         'notas' : list[str] — observaciones del cálculo
     """
     tipo = props['tipo']
-    Qs = 1.0
-    Qa = 1.0
-    notas = []
-    
-    # Clasificar primero para saber si es esbelta
-    clasificacion = clasificar_seccion(props, Fy, E, mostrar=False)
+
+    # Clasificar primero para saber si es esbelta (salvo que ya venga hecho)
+    if clasificacion is None:
+        clasificacion = clasificar_seccion(props, Fy, E, mostrar=False)
     
     if not clasificacion['es_esbelta']:
-        notas.append("Sección no esbelta: Q = 1.0")
-        return {'Q': 1.0, 'Qs': 1.0, 'Qa': 1.0, 'notas': notas}
-    
-    # ------------------------------------------------------------------ #
-    # DOBLE T (incluyendo S-shapes)                                       #
-    # ------------------------------------------------------------------ #
-    if tipo in ['W', 'M', 'HP', 'S', 'IPE', 'IPN', 'IPB', 'IPBl', 'IPBv']:
-        
-        # Ala: elemento no rigidizado
-        if clasificacion['elementos']['ala']['clase'] == 'ESBELTA':
-            bt_ala = props['seccion']['bf_2tf']
-            Qs = _calcular_qs_ala_laminada(bt_ala, E, Fy)
-            notas.append(f"Ala esbelta: bf/2tf = {bt_ala:.2f}, Qs = {Qs:.4f}")
-        
-        # Alma: elemento rigidizado
-        if clasificacion['elementos']['alma']['clase'] == 'ESBELTA':
-            if Fcr is None:
-                notas.append("ADVERTENCIA: Fcr no proporcionado, Qa = 1.0 (conservador)")
-            else:
-                hw_tw = props['seccion']['hw_tw']
-                hw = props['basicas']['d'] - 2 * props['seccion']['tf']
-                A_total = props['basicas']['Ag']
-                Qa = _calcular_qa_alma(hw_tw, E, Fcr, hw, A_total)
-                notas.append(f"Alma esbelta: hw/tw = {hw_tw:.2f}, Qa = {Qa:.4f}")
-    
-    # ------------------------------------------------------------------ #
-    # CANAL                                                               #
-    # ------------------------------------------------------------------ #
-    elif tipo in ['C', 'MC', 'UPN']:
-        
-        # Ala: elemento no rigidizado
-        if clasificacion['elementos']['ala']['clase'] == 'ESBELTA':
-            bt_ala = props['seccion']['bf_2tf']
-            Qs = _calcular_qs_ala_laminada(bt_ala, E, Fy)
-            notas.append(f"Ala esbelta: bf/tf = {bt_ala:.2f}, Qs = {Qs:.4f}")
-        
-        # Alma: elemento rigidizado
-        if clasificacion['elementos']['alma']['clase'] == 'ESBELTA':
-            if Fcr is None:
-                notas.append("ADVERTENCIA: Fcr no proporcionado, Qa = 1.0 (conservador)")
-            else:
-                hw_tw = props['seccion']['hw_tw']
-                hw = props['basicas']['d'] - 2 * props['seccion']['tf']
-                A_total = props['basicas']['Ag']
-                Qa = _calcular_qa_alma(hw_tw, E, Fcr, hw, A_total)
-                notas.append(f"Alma esbelta: hw/tw = {hw_tw:.2f}, Qa = {Qa:.4f}")
-    
-    # ------------------------------------------------------------------ #
-    # ANGULAR                                                             #
-    # ------------------------------------------------------------------ #
-    elif tipo == 'L':
-        
-        if clasificacion['elementos']['pata']['clase'] == 'ESBELTA':
-            bt = props['seccion']['b_t']
-            Qs = _calcular_qs_angular(bt, E, Fy)
-            notas.append(f"Pata esbelta: b/t = {bt:.2f}, Qs = {Qs:.4f}")
-    
-    # ------------------------------------------------------------------ #
-    # PERFIL T                                                            #
-    # ------------------------------------------------------------------ #
-    elif tipo in ['T', 'WT', 'MT', 'ST']:
-        
-        # Ala: elemento no rigidizado
-        if 'ala' in clasificacion['elementos'] and \
-           clasificacion['elementos']['ala']['clase'] == 'ESBELTA':
-            bt_ala = props['seccion']['bf_2tf']
-            Qs = _calcular_qs_ala_laminada(bt_ala, E, Fy)
-            notas.append(f"Ala esbelta: bf/2tf = {bt_ala:.2f}, Qs = {Qs:.4f}")
-        
-        # Stem (alma): elemento no rigidizado para T
-        if 'stem' in clasificacion['elementos'] and \
-           clasificacion['elementos']['stem']['clase'] == 'ESBELTA':
-            dt = props['seccion'].get('d_tw', props['seccion'].get('hw_tw', 0))
-            if dt > 0:
-                Qs_stem = _calcular_qs_stem_perfil_t(dt, E, Fy)
-                Qs = min(Qs, Qs_stem)  # Tomar el menor
-                notas.append(f"Stem esbelta: d/tw = {dt:.2f}, Qs_stem = {Qs_stem:.4f}")
-    
-    # ------------------------------------------------------------------ #
-    # TUBO CIRCULAR                                                       #
-    # ------------------------------------------------------------------ #
-    elif tipo in ['TUBO CIRC.', 'PIPE']:
-        
-        if 'pared' in clasificacion['elementos'] and \
-           clasificacion['elementos']['pared']['clase'] == 'ESBELTA':
-            Dt = props['seccion'].get('D_t', 0)
-            if Dt > 0:
-                Q_tubo = _calcular_q_tubo_circular(Dt, E, Fy)
-                # Para tubos circulares, Q se calcula directamente (no Qs × Qa)
-                Qs = Q_tubo
-                Qa = 1.0
-                notas.append(f"Tubo circular esbelta: D/t = {Dt:.2f}, Q = {Q_tubo:.4f}")
-    
-    # ------------------------------------------------------------------ #
-    # TUBO RECTANGULAR/CUADRADO                                           #
-    # ------------------------------------------------------------------ #
-    elif tipo in ['TUBO CUAD.', 'TUBO RECT.', 'HSS']:
-        
-        # Para HSS, todas las paredes son elementos rigidizados
-        Qa_min = 1.0
-        
-        if 'flange' in clasificacion['elementos'] and \
-           clasificacion['elementos']['flange']['clase'] == 'ESBELTA':
-            if Fcr is not None:
-                bt_flange = props['seccion'].get('b_t', 0)
-                if bt_flange > 0:
-                    Qa_flange = _calcular_qa_hss_pared(bt_flange, E, Fcr)
-                    Qa_min = min(Qa_min, Qa_flange)
-                    notas.append(f"Flange esbelta: b/t = {bt_flange:.2f}, Qa = {Qa_flange:.4f}")
-        
-        if 'web' in clasificacion['elementos'] and \
-           clasificacion['elementos']['web']['clase'] == 'ESBELTA':
-            if Fcr is not None:
-                ht_web = props['seccion'].get('h_tw', 0)
-                if ht_web > 0:
-                    Qa_web = _calcular_qa_hss_pared(ht_web, E, Fcr)
-                    Qa_min = min(Qa_min, Qa_web)
-                    notas.append(f"Web esbelta: h/t = {ht_web:.2f}, Qa = {Qa_web:.4f}")
-        
-        if Fcr is None and Qa_min < 1.0:
-            notas.append("ADVERTENCIA: Fcr no proporcionado, Qa = 1.0 (conservador)")
-            Qa_min = 1.0
-        
-        Qa = Qa_min
-    
-    else:
+        return {'Q': 1.0, 'Qs': 1.0, 'Qa': 1.0, 'notas': ["Sección no esbelta: Q = 1.0"]}
+
+    handler = _HANDLERS_Q.get(tipo)
+    if handler is None:
         raise ValueError(
             f"Tipo '{tipo}' no soportado en calcular_Q. "
             f"Válidos: W, M, HP, S, IPE, IPN, IPB, IPBl, IPBv, C, MC, UPN, L, "
             f"T, WT, MT, ST, TUBO CIRC., PIPE, TUBO CUAD., TUBO RECT., HSS."
         )
+    Qs, Qa, notas = handler(props, clasificacion['elementos'], Fy, E, Fcr)
     
-    # Limitar Qs según AISC: 0.35 ≤ Qs ≤ 0.76
-    if Qs < 0.35:
-        notas.append(f"Qs limitado de {Qs:.4f} a 0.35")
-        Qs = 0.35
-    elif Qs > 0.76:
-        notas.append(f"Qs limitado de {Qs:.4f} a 0.76")
-        Qs = 0.76
+    # Limitar Qs según AISC: 0.35 ≤ Qs ≤ 0.76 (la nota sólo si recorta)
+    Qs_lim = min(max(Qs, 0.35), 0.76)
+    if Qs_lim != Qs:
+        notas.append(f"Qs limitado de {Qs:.4f} a {Qs_lim:.2f}")
+        Qs = Qs_lim
     
     Q = Qs * Qa
     
@@ -441,27 +425,145 @@ def calcular_Q(props: dict, Fy: float, E: float = 200_000,
 # CLASIFICACIÓN DE UN ELEMENTO INDIVIDUAL
 # ============================================================================
 
+# Clases ordenadas de mejor a peor: el código entero es el índice
+_NOMBRES_CLASE = ('COMPACTA', 'NO_COMPACTA', 'ESBELTA')
+
+
+def _codigo_clase(lambda_val: float, lambda_p: float | None, lambda_r: float) -> int:
+    """0 = COMPACTA, 1 = NO_COMPACTA, 2 = ESBELTA.  lambda_p = None → sin λp."""
+    lp = lambda_p if lambda_p is not None else -math.inf
+    # Suma de comparaciones en vez de ramas; 'not ≤' (y no '>') para que
+    # un λ NaN siga cayendo en ESBELTA
+    return (not lambda_val <= lp) + (not lambda_val <= lambda_r)
+
+
 def _clasificar_elemento(nombre: str, lambda_val: float,
-                          lambda_p: float | None, lambda_r: float) -> dict:
+                          lambda_p: float | None, lambda_r: float) -> tuple:
     """
     Clasificar un elemento de la sección.
 
-    Returns dict: 'nombre', 'lambda', 'lambda_p', 'lambda_r', 'clase'
+    Returns (dict, código): dict con 'nombre', 'lambda', 'lambda_p',
+    'lambda_r', 'clase', y el código entero de la clase (_codigo_clase).
     """
-    if lambda_p is not None and lambda_val <= lambda_p:
-        clase = 'COMPACTA'
-    elif lambda_val <= lambda_r:
-        clase = 'NO_COMPACTA'
-    else:
-        clase = 'ESBELTA'
-
+    codigo = _codigo_clase(lambda_val, lambda_p, lambda_r)
+    # Valores sin redondear: el redondeo es sólo de presentación
     return {
         'nombre'  : nombre,
-        'lambda'  : round(lambda_val, 3),
-        'lambda_p': round(lambda_p, 3) if lambda_p is not None else None,
-        'lambda_r': round(lambda_r, 3),
-        'clase'   : clase,
-    }
+        'lambda'  : lambda_val,
+        'lambda_p': lambda_p,
+        'lambda_r': lambda_r,
+        'clase'   : _NOMBRES_CLASE[codigo],
+    }, codigo
+
+
+# ============================================================================
+# CLASIFICACIÓN POR FAMILIA
+# ============================================================================
+#
+# Cada función devuelve (elementos, peor código de clase, advertencias) para
+# un tipo de perfil; el código se acumula al clasificar cada elemento.
+# Las advertencias son siempre tuplas de módulo compartidas (sin lista por
+# llamada), o () si no hay.
+#
+
+_ADV_ANGULAR = (
+    "Ángulo: λp adoptado conservadoramente igual al de ala de doble T "
+    "(0.38·√(E/Fy)). Verificar aplicabilidad según caso de carga.",
+)
+_ADV_PERFIL_T = (
+    "Perfil T: Stem no tiene λp en compresión (solo λr). "
+    "Clasificación: COMPACTA o NO_COMPACTA no aplica para stem.",
+)
+_ADV_TUBO_CIRC = (
+    "Tubo circular: No hay λp en compresión (solo λr = 0.11·E/Fy).",
+)
+_ADV_TUBO_CIRC_SIN_DT = ("D/t no disponible para tubo circular",) + _ADV_TUBO_CIRC
+_ADV_HSS = (
+    "Tubo HSS: No hay λp en compresión (solo λr = 1.40·√(E/Fy)).",
+)
+
+
+def _clasificar_doble_t(props, Fy, E):
+    sec = props['seccion']
+    lim = _limites_familia('DOBLE_T', E, Fy)
+    ala,  c_ala  = _clasificar_elemento('Ala (bf/2tf)', sec['bf_2tf'], *lim['ala'])
+    alma, c_alma = _clasificar_elemento('Alma (hw/tw)', sec['hw_tw'], *lim['alma'])
+    return {'ala': ala, 'alma': alma}, max(c_ala, c_alma), ()
+
+
+def _clasificar_canal(props, Fy, E):
+    sec = props['seccion']
+    lim = _limites_familia('CANAL', E, Fy)
+    ala,  c_ala  = _clasificar_elemento('Ala (bf/tf)', sec['bf_2tf'], *lim['ala'])
+    alma, c_alma = _clasificar_elemento('Alma (hw/tw)', sec['hw_tw'], *lim['alma'])
+    return {'ala': ala, 'alma': alma}, max(c_ala, c_alma), ()
+
+
+def _clasificar_angular(props, Fy, E):
+    sec = props['seccion']
+    lim = _limites_familia('ANGULAR', E, Fy)
+    pata, c_pata = _clasificar_elemento('Pata (b/t)', sec['b_t'], *lim['pata'])
+    return {'pata': pata}, c_pata, _ADV_ANGULAR
+
+
+def _clasificar_perfil_t(props, Fy, E):
+    sec = props['seccion']
+    lim = _limites_familia('PERFIL_T', E, Fy)
+    d_tw = sec.get('d_tw', sec.get('hw_tw', 0))
+    ala,  c_ala  = _clasificar_elemento('Ala (bf/2tf)', sec['bf_2tf'], *lim['ala'])
+    stem, c_stem = _clasificar_elemento('Stem (d/tw)', d_tw, *lim['stem'])
+    return {'ala': ala, 'stem': stem}, max(c_ala, c_stem), _ADV_PERFIL_T
+
+
+def _clasificar_tubo_circular(props, Fy, E):
+    sec = props['seccion']
+    elementos = {}
+
+    D_t = sec.get('D_t', 0)
+    if D_t > 0:
+        lim = _limites_familia('TUBO_CIRC', E, Fy)
+        elementos['pared'], peor = _clasificar_elemento(
+            'Pared (D/t)', D_t, *lim['pared']
+        )
+        return elementos, peor, _ADV_TUBO_CIRC
+
+    return elementos, 0, _ADV_TUBO_CIRC_SIN_DT
+
+
+def _clasificar_hss(props, Fy, E):
+    sec = props['seccion']
+    elementos = {}
+    peor      = 0
+
+    # Flange (ancho)
+    b_t = sec.get('b_t', 0)
+    if b_t > 0:
+        lim = _limites_familia('HSS', E, Fy)
+        elementos['flange'], peor = _clasificar_elemento(
+            'Flange (b/t)', b_t, *lim['flange']
+        )
+
+    # Web (altura) - solo para rectangulares
+    if props['tipo'] in _TIPOS_HSS_RECT:
+        h_tw = sec.get('h_tw', 0)
+        if h_tw > 0:
+            lim = _limites_familia('HSS_RECT', E, Fy)
+            elementos['web'], c_web = _clasificar_elemento(
+                'Web (h/t)', h_tw, *lim['web']
+            )
+            peor = max(peor, c_web)
+
+    return elementos, peor, _ADV_HSS
+
+
+_HANDLERS_CLASIFICAR = {
+    **dict.fromkeys(_TIPOS_DOBLE_T,   _clasificar_doble_t),
+    **dict.fromkeys(_TIPOS_CANAL,     _clasificar_canal),
+    **dict.fromkeys(_TIPOS_ANGULAR,   _clasificar_angular),
+    **dict.fromkeys(_TIPOS_T,         _clasificar_perfil_t),
+    **dict.fromkeys(_TIPOS_TUBO_CIRC, _clasificar_tubo_circular),
+    **dict.fromkeys(_TIPOS_HSS,       _clasificar_hss),
+}
 
 
 # ============================================================================
@@ -472,7 +574,8 @@ def clasificar_seccion(props: dict, Fy: float,
                        E: float = 200_000,
                        mostrar: bool = True,
                        calcular_q: bool = False,
-                       Fcr: float = None) -> dict:
+                       Fcr: float = None,
+                       reporte: bool = False) -> dict:
     """
     Clasificar la sección transversal para flexocompresión.
 
@@ -484,6 +587,8 @@ def clasificar_seccion(props: dict, Fy: float,
     mostrar    : bool  — imprimir reporte en consola
     calcular_q : bool  — calcular factor Q si es esbelta
     Fcr        : float — tensión crítica con Q=1.0 [MPa] (para calcular Qa)
+    reporte    : bool  — devolver el reporte de consola como texto en
+                         'reporte' (independiente de mostrar)
 
     Returns:
     --------
@@ -491,134 +596,22 @@ def clasificar_seccion(props: dict, Fy: float,
         'elementos'    : dict
         'clase_seccion': 'COMPACTA' | 'NO_COMPACTA' | 'ESBELTA'
         'es_esbelta'   : bool
-        'advertencias' : list[str]
+        'advertencias' : tuple[str] — inmutable, () si no hay
         'Q_info'       : dict (si calcular_q=True y es_esbelta=True)
+        'reporte'      : str  (si reporte=True)
     """
-    tipo         = props['tipo']
-    elementos    = {}
-    advertencias = []
-
-    # ------------------------------------------------------------------ #
-    # DOBLE T (incluyendo S-shapes)                                       #
-    # ------------------------------------------------------------------ #
-    if tipo in ['W', 'M', 'HP', 'S', 'IPE', 'IPN', 'IPB', 'IPBl', 'IPBv']:
-
-        lp, lr = _limites_ala_doble_t(E, Fy)
-        elementos['ala'] = _clasificar_elemento(
-            'Ala (bf/2tf)', props['seccion']['bf_2tf'], lp, lr
-        )
-        lp, lr = _limites_alma_doble_t(E, Fy)
-        elementos['alma'] = _clasificar_elemento(
-            'Alma (hw/tw)', props['seccion']['hw_tw'], lp, lr
-        )
-
-    # ------------------------------------------------------------------ #
-    # CANAL                                                               #
-    # ------------------------------------------------------------------ #
-    elif tipo in ['C', 'MC', 'UPN']:
-
-        lp, lr = _limites_ala_canal(E, Fy)
-        elementos['ala'] = _clasificar_elemento(
-            'Ala (bf/tf)', props['seccion']['bf_2tf'], lp, lr
-        )
-        lp, lr = _limites_alma_canal(E, Fy)
-        elementos['alma'] = _clasificar_elemento(
-            'Alma (hw/tw)', props['seccion']['hw_tw'], lp, lr
-        )
-
-    # ------------------------------------------------------------------ #
-    # ANGULAR                                                             #
-    # ------------------------------------------------------------------ #
-    elif tipo == 'L':
-
-        lp, lr = _limites_pata_angular(E, Fy)
-        elementos['pata'] = _clasificar_elemento(
-            'Pata (b/t)', props['seccion']['b_t'], lp, lr
-        )
-        advertencias.append(
-            "Ángulo: λp adoptado conservadoramente igual al de ala de doble T "
-            "(0.38·√(E/Fy)). Verificar aplicabilidad según caso de carga."
-        )
-
-    # ------------------------------------------------------------------ #
-    # PERFIL T                                                            #
-    # ------------------------------------------------------------------ #
-    elif tipo in ['T', 'WT', 'MT', 'ST']:
-
-        lp, lr = _limites_ala_perfil_t(E, Fy)
-        elementos['ala'] = _clasificar_elemento(
-            'Ala (bf/2tf)', props['seccion']['bf_2tf'], lp, lr
-        )
-        
-        lp, lr = _limites_alma_perfil_t(E, Fy)
-        d_tw = props['seccion'].get('d_tw', props['seccion'].get('hw_tw', 0))
-        elementos['stem'] = _clasificar_elemento(
-            'Stem (d/tw)', d_tw, lp, lr
-        )
-        advertencias.append(
-            "Perfil T: Stem no tiene λp en compresión (solo λr). "
-            "Clasificación: COMPACTA o NO_COMPACTA no aplica para stem."
-        )
-
-    # ------------------------------------------------------------------ #
-    # TUBO CIRCULAR                                                       #
-    # ------------------------------------------------------------------ #
-    elif tipo in ['TUBO CIRC.', 'PIPE']:
-
-        lp, lr = _limites_tubo_circular(E, Fy)
-        D_t = props['seccion'].get('D_t', 0)
-        if D_t > 0:
-            elementos['pared'] = _clasificar_elemento(
-                'Pared (D/t)', D_t, lp, lr
-            )
-        else:
-            advertencias.append("D/t no disponible para tubo circular")
-        
-        advertencias.append(
-            "Tubo circular: No hay λp en compresión (solo λr = 0.11·E/Fy)."
-        )
-
-    # ------------------------------------------------------------------ #
-    # TUBO RECTANGULAR/CUADRADO                                           #
-    # ------------------------------------------------------------------ #
-    elif tipo in ['TUBO CUAD.', 'TUBO RECT.', 'HSS']:
-
-        lp, lr = _limites_tubo_rectangular_pared(E, Fy)
-        
-        # Flange (ancho)
-        b_t = props['seccion'].get('b_t', 0)
-        if b_t > 0:
-            elementos['flange'] = _clasificar_elemento(
-                'Flange (b/t)', b_t, lp, lr
-            )
-        
-        # Web (altura) - solo para rectangulares
-        if tipo in ['TUBO RECT.', 'HSS']:
-            h_tw = props['seccion'].get('h_tw', 0)
-            if h_tw > 0:
-                elementos['web'] = _clasificar_elemento(
-                    'Web (h/t)', h_tw, lp, lr
-                )
-        
-        advertencias.append(
-            "Tubo HSS: No hay λp en compresión (solo λr = 1.40·√(E/Fy))."
-        )
+    tipo = props['tipo']
 
-    else:
+    handler = _HANDLERS_CLASIFICAR.get(tipo)
+    if handler is None:
         raise ValueError(
             f"Tipo '{tipo}' no soportado. "
             f"Válidos: W, M, HP, S, IPE, IPN, IPB, IPBl, IPBv, C, MC, UPN, L, "
             f"T, WT, MT, ST, TUBO CIRC., PIPE, TUBO CUAD., TUBO RECT., HSS."
         )
-
-    # Clase global
-    clases = [el['clase'] for el in elementos.values()]
-    if 'ESBELTA' in clases:
-        clase_seccion = 'ESBELTA'
-    elif 'NO_COMPACTA' in clases:
-        clase_seccion = 'NO_COMPACTA'
-    else:
-        clase_seccion = 'COMPACTA'
+    # Clase global: la peor de los elementos, acumulada por el handler
+    elementos, peor, advertencias = handler(props, Fy, E)
+    clase_seccion = _NOMBRES_CLASE[peor]
 
     resultado = {
         'elementos'    : elementos,
@@ -629,63 +622,388 @@ def clasificar_seccion(props: dict, Fy: float,
 
     # Calcular Q si se solicita y la sección es esbelta
     if calcular_q and clase_seccion == 'ESBELTA':
-        Q_info = calcular_Q(props, Fy, E, Fcr)
+        Q_info = calcular_Q(props, Fy, E, Fcr, clasificacion=resultado)
         resultado['Q_info'] = Q_info
 
-    if mostrar:
-        _imprimir_clasificacion(tipo, elementos, clase_seccion, Fy, E, advertencias)
+    if mostrar or reporte:
+        texto = _formatear_clasificacion(tipo, elementos, clase_seccion, Fy, E, advertencias)
         if calcular_q and clase_seccion == 'ESBELTA':
-            _imprimir_factor_Q(Q_info)
+            texto += _formatear_factor_Q(Q_info)
+        if mostrar:
+            sys.stdout.write(texto)
+            sys.stdout.flush()
+        if reporte:
+            resultado['reporte'] = texto
 
     return resultado
 
 
+def clasificar_y_calcular_Q(props: dict, Fy: float,
+                            E: float = 200_000,
+                            Fcr: float = None) -> dict:
+    """
+    Clasificar la sección y calcular Q en una sola pasada, sin imprimir.
+
+    Los handlers de Q trabajan sobre los mismos elementos ya clasificados,
+    así que los límites y ratios se evalúan una única vez por perfil.
+
+    Parámetros:
+    -----------
+    props : dict  — salida de extraer_propiedades()
+    Fy    : float — tensión de fluencia [MPa]
+    E     : float — módulo de elasticidad [MPa] (default: 200 000)
+    Fcr   : float — tensión crítica con Q=1.0 [MPa] (para calcular Qa)
+
+    Returns:
+    --------
+    dict: claves de clasificar_seccion() + 'Q', 'Qs', 'Qa', 'notas'
+          (Q = 1.0 si la sección no es esbelta)
+    """
+    resultado = clasificar_seccion(props, Fy, E, mostrar=False)
+    resultado.update(calcular_Q(props, Fy, E, Fcr, clasificacion=resultado))
+    return resultado
+
+
+# ============================================================================
+# CLASIFICACIÓN EN LOTE (VECTORIZADA)
+# ============================================================================
+#
+# Misma lógica que clasificar_seccion() pero sobre N secciones a la vez.
+# Cada elemento se describe por (clave, familias, ratio); los coeficientes
+# de λp/λr salen de _COEFICIENTES_LIMITES.
+#
+
+_CLASES = np.array(_NOMBRES_CLASE)
+
+_TIPOS_LOTE = {
+    'DOBLE_T'  : _TIPOS_DOBLE_T,
+    'CANAL'    : _TIPOS_CANAL,
+    'ANGULAR'  : _TIPOS_ANGULAR,
+    'PERFIL_T' : _TIPOS_T,
+    'TUBO_CIRC': _TIPOS_TUBO_CIRC,
+    'HSS'      : _TIPOS_HSS,
+    'HSS_RECT' : _TIPOS_HSS_RECT,
+}
+
+_ELEMENTOS_LOTE = [
+    # clave     familias                       ratio
+    ('ala',    ('DOBLE_T', 'CANAL', 'PERFIL_T'), 'bf_2tf'),
+    ('alma',   ('DOBLE_T', 'CANAL'),           'hw_tw'),
+    ('pata',   ('ANGULAR',),                   'b_t'),
+    ('stem',   ('PERFIL_T',),                  'd_tw'),
+    ('pared',  ('TUBO_CIRC',),                 'D_t'),
+    ('flange', ('HSS',),                       'b_t'),
+    ('web',    ('HSS_RECT',),                  'h_tw'),
+]
+
+# Elementos que sólo se clasifican si el ratio está disponible (> 0)
+_ELEMENTOS_OPCIONALES = ('pared', 'flange', 'web')
+
+# Campos del SoA: (clave, subdict de props)
+_CAMPOS_SOA = (
+    ('bf_2tf', 'seccion'),
+    ('hw_tw',  'seccion'),
+    ('b_t',    'seccion'),
+    ('d_tw',   'seccion'),
+    ('D_t',    'seccion'),
+    ('h_tw',   'seccion'),
+    ('tf',     'seccion'),
+    ('d',      'basicas'),
+    ('Ag',     'basicas'),
+)
+
+
+def propiedades_a_soa(props_list: list) -> dict:
+    """
+    Apilar una lista de props (salidas de extraer_propiedades()) en un
+    dict de arrays — una columna por campo, una fila por perfil.
+
+    Campos ausentes → 0.0 (igual que los .get(clave, 0) de clasificar_seccion).
+    'd_tw' toma 'hw_tw' si el perfil no lo tiene (igual que el stem de perfil T).
+
+    Returns dict[str, np.ndarray]: 'tipo' + los campos de _CAMPOS_SOA, shape (N,)
+    """
+    n   = len(props_list)
+    soa = {'tipo': np.array([str(p['tipo']) for p in props_list], dtype=object)}
+    for clave, _ in _CAMPOS_SOA:
+        soa[clave] = np.empty(n)
+
+    for i, p in enumerate(props_list):
+        for clave, grupo in _CAMPOS_SOA:
+            soa[clave][i] = p[grupo].get(clave, 0.0)
+        sec = p['seccion']
+        if 'd_tw' not in sec:
+            soa['d_tw'][i] = sec.get('hw_tw', 0.0)
+
+    return soa
+
+
+def clasificar_secciones_batch(secciones, Fy, E: float = 200_000) -> dict:
+    """
+    Clasificar N secciones de una sola vez con operaciones vectorizadas.
+
+    Equivale a llamar clasificar_seccion(props, Fy, E, mostrar=False) para
+    cada perfil, sin el costo de despacho de Python por sección.
+
+    Parámetros:
+    -----------
+    secciones : dict | list[dict] — SoA de propiedades_a_soa(), o directamente
+                                    la lista de salidas de extraer_propiedades()
+    Fy        : float | array     — tensión de fluencia [MPa] (escalar o una por perfil)
+    E         : float             — módulo de elasticidad [MPa] (default: 200 000)
+
+    Returns:
+    --------
+    dict:
+        'tipo'         : np.ndarray[str]  (N,)
+        'elementos'    : dict[str, dict[str, np.ndarray]]
+                         por elemento: 'lambda', 'lambda_p', 'lambda_r', 'clase',
+                         'codigo' (NaN / '' / -1 donde el elemento no aplica)
+        'clase_seccion': np.ndarray[str]  (N,)
+        'codigo_clase' : np.ndarray[int8] (N,) — 0 COMPACTA, 1 NO_COMPACTA, 2 ESBELTA
+        'es_esbelta'   : np.ndarray[bool] (N,)
+    """
+    soa   = secciones if isinstance(secciones, dict) else propiedades_a_soa(secciones)
+    tipos = soa['tipo']
+    n     = len(tipos)
+    Fy    = np.broadcast_to(np.asarray(Fy, dtype=float), (n,))
+    E_Fy  = E / Fy
+
+    validos = np.isin(tipos, [t for ts in _TIPOS_LOTE.values() for t in ts])
+    if not validos.all():
+        raise ValueError(
+            f"Tipo '{tipos[~validos][0]}' no soportado. "
+            f"Válidos: W, M, HP, S, IPE, IPN, IPB, IPBl, IPBv, C, MC, UPN, L, "
+            f"T, WT, MT, ST, TUBO CIRC., PIPE, TUBO CUAD., TUBO RECT., HSS."
+        )
+    mascaras = {fam: np.isin(tipos, list(ts)) for fam, ts in _TIPOS_LOTE.items()}
+
+    elementos = {}
+    peor      = np.zeros(n, dtype=np.int8)
+
+    for clave, familias, ratio in _ELEMENTOS_LOTE:
+        # Las familias que comparten un elemento comparten coeficientes
+        cp, cr, exp = _COEFICIENTES_LIMITES[familias[0], clave]
+        aplica = np.logical_or.reduce([mascaras[f] for f in familias])
+        if not aplica.any():
+            continue
+
+        lam = soa[ratio]
+        if clave in _ELEMENTOS_OPCIONALES:
+            aplica &= lam > 0
+
+        raiz = E_Fy ** exp
+        lp   = cp * raiz if cp is not None else np.full(n, np.nan)
+        lr   = cr * raiz
+
+        # Código de clase en una pasada: 0/1/2 = (λ > λp) + (λ > λr),
+        # escrito como ~(λ ≤ ·) igual que _codigo_clase (λ NaN → ESBELTA).
+        # Sin λp el elemento nunca es compacto → el primer término vale 1.
+        supera_p = ~(lam <= lp) if cp is not None else np.ones(n, dtype=bool)
+        codigo   = supera_p.astype(np.int8) + (~(lam <= lr)).astype(np.int8)
+        codigo   = np.where(aplica, codigo, np.int8(-1))
+        peor   = np.maximum(peor, codigo)
+
+        elementos[clave] = {
+            'lambda'  : np.where(aplica, lam, np.nan),
+            'lambda_p': np.where(aplica, lp, np.nan),
+            'lambda_r': np.where(aplica, lr, np.nan),
+            'clase'   : np.where(aplica, _CLASES[np.maximum(codigo, 0)], ''),
+            'codigo'  : codigo,
+        }
+
+    return {
+        'tipo'         : tipos,
+        'elementos'    : elementos,
+        'clase_seccion': _CLASES[peor],
+        'codigo_clase' : peor,
+        'es_esbelta'   : peor == 2,
+    }
+
+
+# ============================================================================
+# FACTOR Q EN LOTE (VECTORIZADO)
+# ============================================================================
+#
+# Versiones elemento a elemento de los kernels de Q sobre arrays (N,).
+# Cada una reproduce las ramas del kernel escalar con np.select.
+#
+
+def _calcular_qs_ala_laminada_vec(bt, E, Fy):
+    raiz = np.sqrt(E / Fy)
+    return np.select(
+        [bt <= 0.56 * raiz, bt < 1.03 * raiz],
+        [1.0, 1.415 - 0.74 * bt / raiz],
+        default=0.69 * E / (Fy * bt**2),
+    )
+
+
+def _calcular_qs_angular_vec(bt, E, Fy):
+    raiz = np.sqrt(E / Fy)
+    return np.select(
+        [bt <= 0.45 * raiz, bt <= 0.91 * raiz],
+        [1.0, 1.34 - 0.76 * bt / raiz],
+        default=0.53 * E / (Fy * bt**2),
+    )
+
+
+def _calcular_qs_stem_perfil_t_vec(dt, E, Fy):
+    raiz = np.sqrt(E / Fy)
+    return np.select(
+        [dt <= 0.75 * raiz, dt <= 1.03 * raiz],
+        [1.0, 1.908 - 1.22 * dt / raiz],
+        default=0.69 * E / (Fy * dt**2),
+    )
+
+
+def _calcular_q_tubo_circular_vec(Dt, E, Fy):
+    return np.where(Dt <= 0.11 * E / Fy, 1.0, 0.038 * E / (Fy * Dt))
+
+
+def _calcular_qa_hss_pared_vec(bt, E, Fcr):
+    raiz   = np.sqrt(E / Fcr)
+    factor = raiz / bt
+    be_b   = np.clip((1.0 - 0.34 * factor) * factor, 0.0, 1.0)
+    return np.where(bt < 1.40 * raiz, 1.0, be_b)
+
+
+def _calcular_qa_alma_vec(hw_tw, E, Fcr, b):
+    raiz   = np.sqrt(E / Fcr)
+    factor = raiz / hw_tw
+    be     = np.minimum(b * (1.0 - 0.34 * factor) * factor, b)
+    return np.where(hw_tw < 1.49 * raiz, 1.0, be / b)
+
+
+def calcular_Q_batch(secciones, Fy, E: float = 200_000,
+                     Fcr=None, clasificacion: dict = None) -> dict:
+    """
+    Calcular Q para N secciones de una sola vez (AISC 360-10 Sección E7).
+
+    Mismos valores que calcular_Q() perfil a perfil, sin las notas.
+
+    Parámetros:
+    -----------
+    secciones     : dict | list[dict] — SoA de propiedades_a_soa() o lista de props
+    Fy            : float | array     — tensión de fluencia [MPa]
+    E             : float             — módulo de elasticidad [MPa]
+    Fcr           : float | array     — tensión crítica con Q=1.0 [MPa]
+                                        (None → Qa = 1.0, conservador)
+    clasificacion : dict, opcional    — salida de clasificar_secciones_batch()
+                                        para las mismas secciones/Fy/E
+
+    Returns:
+    --------
+    dict: 'Q', 'Qs', 'Qa' — np.ndarray (N,)
+    """
+    soa = secciones if isinstance(secciones, dict) else propiedades_a_soa(secciones)
+    if clasificacion is None:
+        clasificacion = clasificar_secciones_batch(soa, Fy, E)
+
+    tipos = soa['tipo']
+    n     = len(tipos)
+    Fy    = np.broadcast_to(np.asarray(Fy, dtype=float), (n,))
+    elementos = clasificacion['elementos']
+
+    def esbelto(clave):
+        if clave not in elementos:
+            return np.zeros(n, dtype=bool)
+        return elementos[clave]['clase'] == 'ESBELTA'
+
+    Qs = np.ones(n)
+    Qa = np.ones(n)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Ala no rigidizada: doble T, canal y perfil T
+        m  = esbelto('ala')
+        Qs = np.where(m, _calcular_qs_ala_laminada_vec(soa['bf_2tf'], E, Fy), Qs)
+
+        m  = esbelto('pata')
+        Qs = np.where(m, _calcular_qs_angular_vec(soa['b_t'], E, Fy), Qs)
+
+        m  = esbelto('stem') & (soa['d_tw'] > 0)
+        Qs = np.where(m, np.minimum(Qs, _calcular_qs_stem_perfil_t_vec(soa['d_tw'], E, Fy)), Qs)
+
+        m  = esbelto('pared')
+        Qs = np.where(m, _calcular_q_tubo_circular_vec(soa['D_t'], E, Fy), Qs)
+
+        # Elementos rigidizados: sólo con Fcr
+        if Fcr is not None:
+            Fcr = np.broadcast_to(np.asarray(Fcr, dtype=float), (n,))
+
+            m  = esbelto('alma')
+            hw = soa['d'] - 2 * soa['tf']
+            Qa = np.where(m, _calcular_qa_alma_vec(soa['hw_tw'], E, Fcr, hw), Qa)
+
+            # HSS: Qa = mínimo entre flange y web esbeltas
+            m  = esbelto('flange')
+            Qa = np.where(m, np.minimum(Qa, _calcular_qa_hss_pared_vec(soa['b_t'], E, Fcr)), Qa)
+            m  = esbelto('web')
+            Qa = np.where(m, np.minimum(Qa, _calcular_qa_hss_pared_vec(soa['h_tw'], E, Fcr)), Qa)
+
+    # Limitar Qs según AISC: 0.35 ≤ Qs ≤ 0.76 (sólo secciones esbeltas)
+    esbelta = clasificacion['es_esbelta']
+    Qs = np.where(esbelta, np.clip(Qs, 0.35, 0.76), 1.0)
+    Qa = np.where(esbelta, Qa, 1.0)
+
+    return {'Q': Qs * Qa, 'Qs': Qs, 'Qa': Qa}
+
+
 # ============================================================================
 # REPORTES EN CONSOLA
 # ============================================================================
 
-def _imprimir_clasificacion(tipo, elementos, clase_seccion, Fy, E, advertencias):
+_ICONOS_CLASE = {'COMPACTA': '✅', 'NO_COMPACTA': '⚠️', 'ESBELTA': '❌'}
+_SEP = "=" * 60
+_SUB = "-" * 60
 
-    iconos = {'COMPACTA': '✅', 'NO_COMPACTA': '⚠️', 'ESBELTA': '❌'}
 
-    print("=" * 60)
-    print("  CLASIFICACIÓN DE SECCIÓN — CIRSOC 301 / AISC 360-10")
-    print("=" * 60)
-    print(f"  Tipo : {tipo}    Fy = {Fy} MPa    E = {E} MPa")
-    print("-" * 60)
-    print(f"  {'Elemento':<20} {'λ':>8} {'λp':>8} {'λr':>8}  Clase")
-    print("-" * 60)
+def _formatear_clasificacion(tipo, elementos, clase_seccion, Fy, E, advertencias) -> str:
+    """Reporte de clasificación como texto (una sola cadena)."""
+    lineas = [
+        _SEP,
+        "  CLASIFICACIÓN DE SECCIÓN — CIRSOC 301 / AISC 360-10",
+        _SEP,
+        f"  Tipo : {tipo}    Fy = {Fy} MPa    E = {E} MPa",
+        _SUB,
+        f"  {'Elemento':<20} {'λ':>8} {'λp':>8} {'λr':>8}  Clase",
+        _SUB,
+    ]
 
     for el in elementos.values():
         lp_str = f"{el['lambda_p']:.2f}" if el['lambda_p'] is not None else "  N/A "
-        print(
+        lineas.append(
             f"  {el['nombre']:<20} "
             f"{el['lambda']:>8.2f} "
             f"{lp_str:>8} "
             f"{el['lambda_r']:>8.2f}  "
-            f"{iconos[el['clase']]} {el['clase']}"
+            f"{_ICONOS_CLASE[el['clase']]} {el['clase']}"
         )
 
-    print("=" * 60)
-    print(f"  {iconos[clase_seccion]}  CLASE DE SECCIÓN: {clase_seccion}")
-    print("=" * 60)
+    lineas += [
+        _SEP,
+        f"  {_ICONOS_CLASE[clase_seccion]}  CLASE DE SECCIÓN: {clase_seccion}",
+        _SEP,
+    ]
 
-    for adv in advertencias:
-        print(f"  ⚠️  {adv}")
+    lineas += [f"  ⚠️  {adv}" for adv in advertencias]
     if advertencias:
-        print()
-
-
-def _imprimir_factor_Q(Q_info: dict):
-    """Imprimir reporte del factor Q"""
-    print("=" * 60)
-    print("  FACTOR Q — REDUCCIÓN POR ELEMENTOS ESBELTOS (AISC E7)")
-    print("=" * 60)
-    print(f"  Qs (no rigidizados) : {Q_info['Qs']:.4f}")
-    print(f"  Qa (rigidizados)    : {Q_info['Qa']:.4f}")
-    print(f"  Q = Qs × Qa         : {Q_info['Q']:.4f}")
-    print("-" * 60)
-    for nota in Q_info['notas']:
-        print(f"  • {nota}")
-    print("=" * 60)
-    print()
+        lineas.append("")
+
+    return "\n".join(lineas) + "\n"
+
+
+def _formatear_factor_Q(Q_info: dict) -> str:
+    """Reporte del factor Q como texto (una sola cadena)."""
+    lineas = [
+        _SEP,
+        "  FACTOR Q — REDUCCIÓN POR ELEMENTOS ESBELTOS (AISC E7)",
+        _SEP,
+        f"  Qs (no rigidizados) : {Q_info['Qs']:.4f}",
+        f"  Qa (rigidizados)    : {Q_info['Qa']:.4f}",
+        f"  Q = Qs × Qa         : {Q_info['Q']:.4f}",
+        _SUB,
+    ]
+    lineas += [f"  • {nota}" for nota in Q_info['notas']]
+    lineas += [_SEP, ""]
+    return "\n".join(lineas) + "\n"
+
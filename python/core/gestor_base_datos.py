@@ -17,9 +17,256 @@ Unidades almacenadas en la BD:
 """
 
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 
+_raiz_python = os.path.normpath(os.path.join(os.path.dirname(__file__), '..'))
+if _raiz_python not in sys.path:
+    sys.path.insert(0, _raiz_python)
+
+from core.utilidades_perfil import (
+    determinar_familia, determinar_familias, extraer_propiedades,
+)
+
+
+# Versión del formato del caché .parquet: incrementar si cambia la forma
+# en que se procesan los CSV, para invalidar cachés viejos.
+_VERSION_CACHE = 2
+
+
+# Columnas de texto conocidas: nunca se convierten a número
+_COLUMNAS_TEXTO = frozenset({'Tipo', 'PERFIL', 'PERFIL_METRICO', 'Designacion'})
+
+# Valores no nulos que se miran para decidir si una columna de texto es numérica
+_MUESTRA_TIPOS = 64
+
+# Columnas (altura, anchos en orden de preferencia) del resumen por tipo.
+# Doble T, T y tubos usan las columnas por defecto: d (altura o diámetro)
+# y bf.
+_DIM_COLS_DEFECTO = ('d', ('bf',))
+_DIM_COLS = {
+    # Canales: bf, o b si la BD no tiene bf
+    'C'  : ('d', ('bf', 'b')),
+    'MC' : ('d', ('bf', 'b')),
+    'UPN': ('d', ('bf', 'b')),
+    # Angulares: lado y espesor
+    'L'  : ('b', ('t',)),
+}
+
+
+def _convertir_numericas(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convertir a número las columnas que el parser dejó como texto.
+
+    El parser C ya entrega como numéricas las columnas limpias; sólo quedan
+    como texto las que mezclan separadores decimales (la BD CIRSOC tiene
+    tanto '7,6' como '1.112' en una misma columna), que decimal=',' no
+    resuelve. A esas se les normaliza la coma a punto.
+    En pandas 3.x, pd.to_numeric con errors='ignore' fue removido: si la
+    conversión no logra ningún valor, la columna se deja como está.
+    Una columna de texto no listada en _COLUMNAS_TEXTO se descarta mirando
+    sólo sus primeros _MUESTRA_TIPOS valores: si ninguno es número, no se
+    convierte la columna entera.
+    """
+    for col in df.columns:
+        if col in _COLUMNAS_TEXTO or not pd.api.types.is_string_dtype(df[col]):
+            continue
+        try:
+            muestra = df[col].dropna().head(_MUESTRA_TIPOS)
+            muestra = muestra.str.replace(',', '.', regex=False)
+            if len(muestra) and pd.to_numeric(muestra, errors='coerce').isna().all():
+                continue
+            temp = df[col].str.replace(',', '.', regex=False)
+            convertida = pd.to_numeric(temp, errors='coerce')
+            if convertida.notna().sum() > 0:
+                df[col] = convertida
+        except Exception:
+            pass
+    return df
+
+
+def _categorizar_tipo(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Guardar 'Tipo' como categórica: hay pocas familias y se filtra seguido
+    por igualdad, que así compara códigos enteros en vez de strings.
+    """
+    if 'Tipo' in df.columns:
+        df['Tipo'] = df['Tipo'].astype('category')
+    return df
+
+
+def _construir_indices(df: pd.DataFrame) -> dict:
+    """
+    Índices hash de una BD para las consultas frecuentes (posiciones iloc).
+
+        'perfil'      : {PERFIL: array de posiciones, en orden de la BD}
+        'tipo_perfil' : {(Tipo, PERFIL): array de posiciones}
+        'por_tipo'    : {Tipo: lista ordenada de PERFIL}
+        'familias'    : lista ordenada de Tipo
+    """
+    if 'Tipo' not in df.columns or 'PERFIL' not in df.columns:
+        return {'perfil': {}, 'tipo_perfil': {}, 'por_tipo': {}, 'familias': []}
+    perfiles = df['PERFIL']
+    por_tipo = {
+        tipo: sorted(perfiles.iloc[pos].tolist())
+        for tipo, pos in df.groupby('Tipo', observed=True).indices.items()
+    }
+    return {
+        'perfil'     : df.groupby('PERFIL').indices,
+        'tipo_perfil': df.groupby(['Tipo', 'PERFIL'], observed=True).indices,
+        'por_tipo'   : por_tipo,
+        'familias'   : sorted(por_tipo),
+    }
+
+
+def _construir_resumenes(df: pd.DataFrame, base: str) -> list:
+    """
+    Resumen de cada fila de una BD, en orden de posición (iloc), para
+    obtener_resumen_perfil. Valores en unidades CIRSOC: Ag [cm²],
+    d/bf [mm], Peso [kg/m].
+    """
+    # Columnas comunes
+    col_peso = 'W' if base == 'AISC' else 'Peso'
+    col_area = 'A' if base == 'AISC' else 'Ag'
+    
+    vacia = np.full(len(df), np.nan)
+    
+    def _col(col):
+        return df[col].to_numpy() if col in df.columns else vacia
+    
+    # AISC: A en mm² → convertir a cm²
+    area = _col(col_area)
+    if base == 'AISC':
+        area = area / 100
+    peso  = _col(col_peso)
+    tipos = df['Tipo'].tolist() if 'Tipo' in df.columns else ['N/A'] * len(df)
+    
+    # Dimensiones según tipo de perfil: columnas resueltas una vez por tipo
+    dims = {}
+    for tipo in set(tipos):
+        col_altura, cols_ancho = _DIM_COLS.get(tipo, _DIM_COLS_DEFECTO)
+        col_ancho = next((c for c in cols_ancho if c in df.columns), None)
+        dims[tipo] = (_col(col_altura), _col(col_ancho) if col_ancho else vacia)
+    
+    return [
+        {
+            'tipo'  : tipo,
+            'peso'  : peso[i],
+            'area'  : area[i],
+            'altura': dims[tipo][0][i],
+            'ancho' : dims[tipo][1][i],
+        }
+        for i, tipo in enumerate(tipos)
+    ]
+
+
+def _copiar_propiedades(props: dict) -> dict:
+    """
+    Copia de un dict de extraer_propiedades que no comparte nada mutable
+    con el original. Los valores son escalares o str, así que basta copiar
+    los sub-dicts y la lista 'disponibles' (mucho más barato que deepcopy).
+    """
+    return {
+        clave: valor.copy() if isinstance(valor, (dict, list)) else valor
+        for clave, valor in props.items()
+    }
+
+
+def _agregar_familias(df: pd.DataFrame, base: str):
+    """
+    Agregar a una BD ya cargada la columna '_familia', resuelta una sola vez
+    (no va al caché parquet: depende de FAMILIAS, no del CSV).
+
+    Si el cálculo vectorizado falla se resuelve fila por fila con
+    determinar_familia; si también falla, la BD queda sin la columna y
+    extraer_propiedades determina la familia en cada consulta. Nunca se
+    descartan los perfiles ya leídos.
+    """
+    try:
+        df['_familia'] = determinar_familias(df)
+        return
+    except Exception as e:
+        print(f"⚠️  {base}: familias no vectorizadas ({e}); se resuelven por fila")
+    try:
+        df['_familia'] = pd.Series(
+            [determinar_familia(str(fila['Tipo']).strip(), fila)
+             for _, fila in df.iterrows()],
+            index=df.index, dtype='category',
+        )
+    except Exception as e:
+        print(f"⚠️  {base}: sin columna '_familia' ({e})")
+
+
+def _leer_con_cache(ruta: str, leer_csv) -> pd.DataFrame:
+    """
+    Leer una BD desde su CSV usando un .parquet al lado como caché.
+
+    El parquet se usa si es más nuevo que el CSV. Si no existe, está
+    desactualizado o no hay motor parquet (pyarrow), se lee el CSV con
+    leer_csv(ruta) y se intenta regenerar el caché; cualquier error del
+    caché se ignora y sólo cuesta volver a leer el CSV.
+    """
+    cache = f"{ruta}.v{_VERSION_CACHE}.parquet"
+    try:
+        if os.path.getmtime(cache) >= os.path.getmtime(ruta):
+            return pd.read_parquet(cache)
+    except Exception:
+        pass
+
+    df = leer_csv(ruta)
+    try:
+        df.to_parquet(cache, compression='zstd')
+    except Exception:
+        pass
+    return df
+
+
+# na_values: '-' cubre los valores vacíos tipográficos de ambas BDs.
+_NA_VALUES = ['-']
+
+
+def _leer_aisc(ruta: str) -> pd.DataFrame:
+    """Leer y procesar el CSV AISC."""
+    df = pd.read_csv(ruta, na_values=_NA_VALUES, encoding='utf-8-sig')
+    df.columns = df.columns.str.strip()
+    return _categorizar_tipo(_convertir_numericas(df))
+
+
+def _leer_cirsoc(ruta: str) -> pd.DataFrame:
+    """Leer y procesar el CSV CIRSOC (delimitador ; y decimal ,)."""
+    df = pd.read_csv(
+        ruta,
+        sep=';',
+        decimal=',',
+        na_values=_NA_VALUES,
+        encoding='utf-8-sig'  # Maneja BOM
+    )
+    df.columns = df.columns.str.strip()
+    return _categorizar_tipo(_convertir_numericas(df))
+
+
+# Archivo y lector de cada BD
+_ARCHIVOS_BD = {
+    'AISC'  : ('perfiles_SI.csv',            _leer_aisc),
+    'CIRSOC': ('cirsoc-shapes-database.csv', _leer_cirsoc),
+}
+
+
+def _resolver_carpeta(carpeta_datos=None) -> str:
+    """Carpeta de los CSV: la dada, o la de STEELCHECK_ROOT / la del repo."""
+    if carpeta_datos is not None:
+        return carpeta_datos
+    raiz_env = os.environ.get('STEELCHECK_ROOT', None)
+    if raiz_env:
+        return os.path.join(raiz_env, 'database')
+    _este_archivo = os.path.abspath(__file__)
+    _carpeta      = os.path.dirname(_este_archivo)        # python/core/
+    return os.path.normpath(
+        os.path.join(_carpeta, '..', '..', 'database')    # raíz/database/
+    )
+
 
 class GestorBaseDatos:
     """Gestor de bases de datos de perfiles estructurales."""
@@ -35,93 +282,96 @@ class GestorBaseDatos:
                 2. Ruta relativa a este archivo         → ../../database
                    (python/core/ → python/ → raíz/ → database/)
         """
-        if carpeta_datos is None:
-            raiz_env = os.environ.get('STEELCHECK_ROOT', None)
-            if raiz_env:
-                self.carpeta_datos = os.path.join(raiz_env, 'database')
-            else:
-                _este_archivo = os.path.abspath(__file__)
-                _carpeta      = os.path.dirname(_este_archivo)        # python/core/
-                self.carpeta_datos = os.path.normpath(
-                    os.path.join(_carpeta, '..', '..', 'database')    # raíz/database/
-                )
-        else:
-            self.carpeta_datos = carpeta_datos
+        self.carpeta_datos = _resolver_carpeta(carpeta_datos)
 
-        self.db_aisc   = None
-        self.db_cirsoc = None
-        self.db_activa = 'CIRSOC'
-        self._cargar_bases_de_datos()
+        # Las BDs se cargan en el primer acceso (ver _base / precargar)
+        self._bases     = {'AISC': None, 'CIRSOC': None}
+        self._indices   = {}
+        self._resumenes = {}
+        self._propiedades = {}
+        self.db_activa  = 'CIRSOC'
 
     # ------------------------------------------------------------------ #
     # CARGA                                                               #
     # ------------------------------------------------------------------ #
 
-    def _cargar_bases_de_datos(self):
-        """Cargar ambas bases de datos desde CSV."""
-
-        # na_values: '-' cubre los valores vacíos tipográficos de ambas BDs.
-        _na = ['-']
-
-        # En pandas 3.x, pd.to_numeric con errors='ignore' fue removido.
-        # Se convierte columna por columna intentando numérico; si falla, se deja como está.
-        def _convertir_numericas(df: pd.DataFrame) -> pd.DataFrame:
-            for col in df.columns:
-                # Saltar columnas de texto conocidas
-                if col in ['Tipo', 'PERFIL', 'PERFIL_METRICO', 'Designacion']:
-                    continue
-                    
-                try:
-                    # Verificar si es string/object (pandas 2.x usa 'object', 3.x usa 'str' o 'string')
-                    is_string = df[col].dtype in ['object', 'str', 'string'] or \
-                                pd.api.types.is_string_dtype(df[col])
-                    
-                    if is_string:
-                        # Reemplazar coma por punto para decimales
-                        temp = df[col].astype(str).str.replace(',', '.', regex=False)
-                        convertida = pd.to_numeric(temp, errors='coerce')
-                        
-                        # Solo reemplazar si hay conversiones exitosas
-                        if convertida.notna().sum() > 0:
-                            df[col] = convertida
-                    else:
-                        # Si ya es numérico, intentar conversión directa
-                        convertida = pd.to_numeric(df[col], errors='coerce')
-                        if convertida.notna().sum() > df[col].notna().sum() * 0.3:
-                            df[col] = convertida
-                except Exception:
-                    pass
-            return df
-
-        # AISC
-        try:
-            ruta = os.path.join(self.carpeta_datos, 'perfiles_SI.csv')
-            self.db_aisc = pd.read_csv(ruta, na_values=_na)
-            self.db_aisc.columns = self.db_aisc.columns.str.strip()
-            self.db_aisc = _convertir_numericas(self.db_aisc)
-            print(f"✓ AISC cargada: {len(self.db_aisc)} perfiles")
-            print(f"  Familias: {sorted(self.db_aisc['Tipo'].unique().tolist())}")
-        except Exception as e:
-            print(f"⚠️  Error al cargar AISC: {e}")
-            self.db_aisc = pd.DataFrame()
+    def _leer_base(self, nombre: str) -> pd.DataFrame:
+        """Leer y procesar una BD (AISC | CIRSOC) desde su CSV o su caché."""
+        archivo, leer_csv = _ARCHIVOS_BD[nombre]
+        return _leer_con_cache(os.path.join(self.carpeta_datos, archivo), leer_csv)
+
+    def _cargar(self, nombre: str, lectura=None) -> pd.DataFrame:
+        """
+        Cargar una BD y construir sus índices.
 
-        # CIRSOC (delimitador ; y decimal ,)
+        lectura : Future con la lectura ya lanzada por precargar(), o None
+                  para leer acá mismo.
+        """
         try:
-            ruta = os.path.join(self.carpeta_datos, 'cirsoc-shapes-database.csv')
-            self.db_cirsoc = pd.read_csv(
-                ruta,
-                sep=';',
-                decimal=',',
-                na_values=_na,
-                encoding='utf-8-sig'  # Maneja BOM
-            )
-            self.db_cirsoc.columns = self.db_cirsoc.columns.str.strip()
-            self.db_cirsoc = _convertir_numericas(self.db_cirsoc)
-            print(f"✓ CIRSOC cargada: {len(self.db_cirsoc)} perfiles")
-            print(f"  Familias: {sorted(self.db_cirsoc['Tipo'].unique().tolist())}")
+            df = lectura.result() if lectura is not None else self._leer_base(nombre)
+            print(f"✓ {nombre} cargada: {len(df)} perfiles")
+            print(f"  Familias: {sorted(df['Tipo'].unique().tolist())}")
         except Exception as e:
-            print(f"⚠️  Error al cargar CIRSOC: {e}")
-            self.db_cirsoc = pd.DataFrame()
+            print(f"⚠️  Error al cargar {nombre}: {e}")
+            df = pd.DataFrame()
+        if not df.empty:
+            _agregar_familias(df, nombre)
+        self._indices[nombre] = _construir_indices(df)
+        self._bases[nombre]   = df
+        return df
+
+    def _base(self, nombre: str) -> pd.DataFrame:
+        """BD por nombre; se carga recién en el primer acceso."""
+        df = self._bases[nombre]
+        return df if df is not None else self._cargar(nombre)
+
+    def _asignar(self, nombre: str, df: pd.DataFrame):
+        """
+        Reemplazar una BD (setters de db_aisc / db_cirsoc): se reconstruyen
+        sus índices y se descartan los resúmenes y propiedades cacheados.
+        Con None se vuelve a leer del CSV en el próximo acceso.
+        """
+        self._resumenes.pop(nombre, None)
+        self._propiedades.pop(nombre, None)
+        if df is None:
+            self._indices.pop(nombre, None)
+        else:
+            self._indices[nombre] = _construir_indices(df)
+        self._bases[nombre] = df
+
+    def precargar(self):
+        """
+        Cargar en paralelo las BDs que todavía no se leyeron.
+
+        El parser CSV y la lectura parquet liberan el GIL, así que las dos
+        lecturas se solapan; los mensajes e índices se generan después, en
+        orden.
+        """
+        pendientes = [n for n, df in self._bases.items() if df is None]
+        if not pendientes:
+            return
+        with ThreadPoolExecutor(max_workers=len(pendientes)) as ex:
+            lecturas = {n: ex.submit(self._leer_base, n) for n in pendientes}
+        for nombre in pendientes:
+            self._cargar(nombre, lecturas[nombre])
+
+    @property
+    def db_aisc(self) -> pd.DataFrame:
+        """BD AISC; se carga recién en el primer acceso."""
+        return self._base('AISC')
+
+    @db_aisc.setter
+    def db_aisc(self, df: pd.DataFrame):
+        self._asignar('AISC', df)
+
+    @property
+    def db_cirsoc(self) -> pd.DataFrame:
+        """BD CIRSOC; se carga recién en el primer acceso."""
+        return self._base('CIRSOC')
+
+    @db_cirsoc.setter
+    def db_cirsoc(self, df: pd.DataFrame):
+        self._asignar('CIRSOC', df)
 
     # ------------------------------------------------------------------ #
     # SELECCIÓN DE BASE ACTIVA                                            #
@@ -143,9 +393,16 @@ class GestorBaseDatos:
 
     def obtener_base_activa(self) -> pd.DataFrame:
         """Retornar copia de la base de datos activa."""
-        if self.db_activa == 'AISC':
-            return self.db_aisc.copy()
-        return self.db_cirsoc.copy()
+        return self._base_activa().copy()
+
+    def _base_activa(self) -> pd.DataFrame:
+        """Base activa sin copiar: sólo para lecturas internas."""
+        return self._base(self.db_activa)
+
+    def _indices_activos(self) -> dict:
+        """Índices de la base activa (la carga si todavía no se usó)."""
+        self._base_activa()
+        return self._indices[self.db_activa]
 
     def nombre_base_activa(self) -> str:
         return self.db_activa
@@ -156,17 +413,11 @@ class GestorBaseDatos:
 
     def obtener_familias(self) -> list:
         """Listar familias disponibles en la base activa."""
-        db = self.obtener_base_activa()
-        if 'Tipo' in db.columns:
-            return sorted(db['Tipo'].dropna().unique().tolist())
-        return []
+        return list(self._indices_activos()['familias'])
 
     def obtener_perfiles_por_familia(self, familia: str) -> list:
         """Listar perfiles de una familia específica."""
-        db = self.obtener_base_activa()
-        if 'Tipo' in db.columns:
-            return sorted(db[db['Tipo'] == familia]['PERFIL'].tolist())
-        return []
+        return list(self._indices_activos()['por_tipo'].get(familia, []))
 
     def obtener_datos_perfil(self, nombre_perfil: str, tipo: str = None) -> pd.Series:
         """
@@ -189,32 +440,62 @@ class GestorBaseDatos:
         -------
         ValueError si el perfil no existe.
         """
-        db = self.obtener_base_activa()
+        return self._base_activa().iloc[self._posicion_perfil(nombre_perfil, tipo)]
+
+    def _posicion_perfil(self, nombre_perfil: str, tipo: str = None) -> int:
+        """
+        Posición (iloc) de un perfil en la base activa, con las mismas
+        reglas y advertencias que obtener_datos_perfil.
+        """
+        db      = self._base_activa()
+        indices = self._indices_activos()
         
         # Búsqueda por TIPO + PERFIL (exacta)
         if tipo is not None:
-            matches = db[(db['Tipo'] == tipo) & (db['PERFIL'] == nombre_perfil)]
-            if len(matches) == 0:
+            pos = indices['tipo_perfil'].get((tipo, nombre_perfil))
+            if pos is None:
                 raise ValueError(
                     f"Perfil '{tipo} {nombre_perfil}' no encontrado en {self.db_activa}."
                 )
-            return matches.iloc[0]
+            return pos[0]
         
         # Búsqueda solo por PERFIL
-        matches = db[db['PERFIL'] == nombre_perfil]
+        pos = indices['perfil'].get(nombre_perfil)
         
-        if len(matches) == 0:
+        if pos is None:
             raise ValueError(
                 f"Perfil '{nombre_perfil}' no encontrado en {self.db_activa}."
             )
         
-        if len(matches) > 1:
-            tipos = matches['Tipo'].unique().tolist()
-            print(f"⚠️  ADVERTENCIA: '{nombre_perfil}' existe en {len(matches)} tipos: {tipos}")
-            print(f"    Usando: {matches.iloc[0]['Tipo']} {nombre_perfil}")
+        if len(pos) > 1:
+            tipos = db['Tipo'].iloc[pos].unique().tolist()
+            print(f"⚠️  ADVERTENCIA: '{nombre_perfil}' existe en {len(pos)} tipos: {tipos}")
+            print(f"    Usando: {db['Tipo'].iloc[pos[0]]} {nombre_perfil}")
             print(f"    Para especificar, use: obtener_datos_perfil('{nombre_perfil}', tipo='...')")
         
-        return matches.iloc[0]
+        return pos[0]
+
+    def obtener_propiedades_perfil(self, nombre_perfil: str, tipo: str = None) -> dict:
+        """
+        Propiedades de un perfil en mm / mm² / mm⁴ / mm⁶ (salida de
+        extraer_propiedades), con la misma búsqueda que obtener_datos_perfil.
+
+        Se extraen una sola vez por perfil y base. Cada consulta devuelve
+        una copia propia: modificarla no altera el cache ni los cálculos
+        siguientes.
+
+        Raises:
+        -------
+        ValueError si el perfil no existe o su tipo no está soportado.
+        """
+        pos   = self._posicion_perfil(nombre_perfil, tipo)
+        cache = self._propiedades.setdefault(self.db_activa, {})
+        props = cache.get(pos)
+        if props is None:
+            props = extraer_propiedades(self._base_activa().iloc[pos],
+                                        base_datos=self.db_activa)
+            cache[pos] = props
+        return _copiar_propiedades(props)
 
     def obtener_resumen_perfil(self, nombre_perfil: str, tipo: str = None) -> dict | None:
         """
@@ -229,50 +510,15 @@ class GestorBaseDatos:
             Tipo de perfil para búsqueda exacta
         """
         try:
-            p = self.obtener_datos_perfil(nombre_perfil, tipo=tipo)
-            tipo_perfil = p.get('Tipo', 'N/A')
-            
-            # Columnas comunes
-            col_peso = 'W' if self.db_activa == 'AISC' else 'Peso'
-            col_area = 'A' if self.db_activa == 'AISC' else 'Ag'
+            pos = self._posicion_perfil(nombre_perfil, tipo=tipo)
             
-            # AISC: A en mm² → convertir a cm²
-            area_raw = p.get(col_area, np.nan)
-            area_cm2 = area_raw / 100 if self.db_activa == 'AISC' else area_raw
+            # Resúmenes de toda la base, armados en la primera consulta
+            resumenes = self._resumenes.get(self.db_activa)
+            if resumenes is None:
+                resumenes = _construir_resumenes(self._base_activa(), self.db_activa)
+                self._resumenes[self.db_activa] = resumenes
             
-            # Dimensiones según tipo de perfil
-            if tipo_perfil in ['W', 'M', 'HP', 'IPN', 'IPE', 'IPB', 'IPBv', 'IPBl']:
-                # Perfiles doble T
-                altura = p.get('d', np.nan)
-                ancho = p.get('bf', np.nan)
-            elif tipo_perfil in ['C', 'MC', 'UPN']:
-                # Canales
-                altura = p.get('d', np.nan)
-                ancho = p.get('bf', np.nan) if 'bf' in p else p.get('b', np.nan)
-            elif tipo_perfil == 'L':
-                # Angulares - usar columnas especificas
-                altura = p.get('b', np.nan)  # lado
-                ancho = p.get('t', np.nan)   # espesor
-            elif 'TUBO' in tipo_perfil:
-                # Tubos - diámetro o dimensiones
-                altura = p.get('d', np.nan)  # diámetro o altura
-                ancho = p.get('bf', np.nan) if 'bf' in p else np.nan
-            elif tipo_perfil == 'T':
-                # Perfiles T
-                altura = p.get('d', np.nan)
-                ancho = p.get('bf', np.nan)
-            else:
-                altura = p.get('d', np.nan)
-                ancho = p.get('bf', np.nan)
-            
-            return {
-                'nombre': nombre_perfil,
-                'tipo': tipo_perfil,
-                'peso': p.get(col_peso, np.nan),
-                'area': area_cm2,
-                'altura': altura,
-                'ancho': ancho,
-            }
+            return {'nombre': nombre_perfil, **resumenes[pos]}
         except Exception:
             return None
 
@@ -286,30 +532,52 @@ class GestorBaseDatos:
             buscar_perfiles('d',  valor_min=300, valor_max=500)
             buscar_perfiles('Ag', valor_min=50)
         """
-        db = self.obtener_base_activa()
+        db = self._base_activa()
         if criterio == 'Tipo':
             if valor_min is not None:
-                return db[db['Tipo'] == valor_min].copy()
+                # Tipo es categórica: se comparan los códigos enteros
+                tipos = db['Tipo']
+                if isinstance(tipos.dtype, pd.CategoricalDtype):
+                    categorias = tipos.cat.categories
+                    codigo = categorias.get_loc(valor_min) if valor_min in categorias else -2
+                    return db[tipos.cat.codes.to_numpy() == codigo].copy()
+                return db[tipos == valor_min].copy()
         elif criterio in db.columns:
-            res = db.copy()
+            # Sin filtros se devuelve una copia, nunca la BD interna
+            if valor_min is None and valor_max is None:
+                return db.copy()
+            # Una sola máscara y un solo filtrado de la BD. Columnas numéricas:
+            # comparación directa sobre el array (NaN nunca cumple)
+            col = db[criterio]
+            if pd.api.types.is_numeric_dtype(col):
+                col = col.to_numpy(dtype=np.float64, na_value=np.nan)
+            mask = np.ones(len(db), dtype=bool)
             if valor_min is not None:
-                res = res[res[criterio] >= valor_min]
+                mask &= np.asarray(col >= valor_min)
             if valor_max is not None:
-                res = res[res[criterio] <= valor_max]
-            return res
+                mask &= np.asarray(col <= valor_max)
+            return db[mask]
         return pd.DataFrame()
 
     def estadisticas(self) -> dict:
         """Estadísticas básicas de la base activa. Peso en kg/m, altura en mm."""
-        db       = self.obtener_base_activa()
+        db       = self._base_activa()
         col_peso = 'W' if self.db_activa == 'AISC' else 'Peso'
+
+        # min/max de peso y altura en una sola agregación
+        columnas = [c for c in (col_peso, 'd') if c in db.columns]
+        rango    = db[columnas].agg(['min', 'max']) if columnas else None
+
+        def _rango(col, estadistico):
+            return rango.at[estadistico, col] if col in columnas else np.nan
+
         return {
             'total_perfiles': len(db),
             'familias'      : db['Tipo'].nunique() if 'Tipo' in db.columns else 0,
-            'peso_min'      : db[col_peso].min() if col_peso in db.columns else np.nan,
-            'peso_max'      : db[col_peso].max() if col_peso in db.columns else np.nan,
-            'altura_min'    : db['d'].min() if 'd' in db.columns else np.nan,
-            'altura_max'    : db['d'].max() if 'd' in db.columns else np.nan,
+            'peso_min'      : _rango(col_peso, 'min'),
+            'peso_max'      : _rango(col_peso, 'max'),
+            'altura_min'    : _rango('d', 'min'),
+            'altura_max'    : _rango('d', 'max'),
         }
     
     def verificar_nombres_ambiguos(self) -> dict:
@@ -323,27 +591,45 @@ class GestorBaseDatos:
             'lista': list[dict] - detalles de cada nombre ambiguo
             'total_duplicados': int - total de perfiles afectados
         """
-        db = self.obtener_base_activa()
-        
-        # Contar ocurrencias de cada nombre
-        conteo = db['PERFIL'].value_counts()
-        nombres_duplicados = conteo[conteo > 1]
+        db = self._base_activa()
         
-        lista_ambiguos = []
-        total_afectados = 0
+        # Ocurrencias y tipos de cada nombre repetido: el groupby recorre
+        # sólo las filas cuyo PERFIL aparece más de una vez
+        repetidos = db['PERFIL'].duplicated(keep=False).to_numpy()
+        grupos    = db[repetidos].groupby('PERFIL', sort=False)['Tipo'].agg(['size', 'unique'])
         
-        for nombre, count in nombres_duplicados.items():
-            matches = db[db['PERFIL'] == nombre]
-            tipos = matches['Tipo'].unique().tolist()
-            lista_ambiguos.append({
-                'nombre': nombre,
-                'ocurrencias': int(count),
-                'tipos': tipos
-            })
-            total_afectados += count
+        lista_ambiguos = [
+            {'nombre': nombre, 'ocurrencias': int(count), 'tipos': list(tipos)}
+            for nombre, count, tipos in grupos.itertuples()
+        ]
+        total_afectados = grupos['size'].sum()
         
         return {
             'ambiguos': len(lista_ambiguos),
             'lista': sorted(lista_ambiguos, key=lambda x: x['ocurrencias'], reverse=True),
             'total_duplicados': int(total_afectados)
         }
+
+
+# ====================================================================== #
+# INSTANCIA COMPARTIDA                                                    #
+# ====================================================================== #
+
+_GESTORES: dict = {}
+
+
+def obtener_gestor(carpeta_datos=None) -> GestorBaseDatos:
+    """
+    Retornar un GestorBaseDatos compartido por proceso (uno por carpeta).
+
+    Evita volver a leer las BDs cada vez que se necesita un gestor. La
+    carpeta se resuelve en cada llamada (STEELCHECK_ROOT incluida), así que
+    si cambia se obtiene el gestor de la carpeta nueva. La base activa es
+    estado de la instancia: quienes la compartan ven los cambios de
+    cambiar_base().
+    """
+    carpeta = os.path.abspath(_resolver_carpeta(carpeta_datos))
+    gestor  = _GESTORES.get(carpeta)
+    if gestor is None:
+        gestor = _GESTORES[carpeta] = GestorBaseDatos(carpeta)
+    return gestor
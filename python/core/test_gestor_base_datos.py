@@ -4,12 +4,12 @@ test_gestor_base_datos.py
 Script de prueba para validar el GestorBaseDatos actualizado.
 """
 
-import os
-os.environ['STEELCHECK_ROOT'] = 'C:\git\perfiles-verificacion'
-
-from gestor_base_datos import GestorBaseDatos
+from gestor_base_datos import obtener_gestor
 import pandas as pd
 
+# Columnas de identificación (no cuentan como datos del perfil)
+COLUMNAS_NO_DATOS = {'Tipo', 'PERFIL', '_familia'}
+
 def print_separator(title):
     """Separador visual para la consola."""
     print("\n" + "="*70)
@@ -20,7 +20,9 @@ def test_carga_bases():
     """Test 1: Verificar carga de ambas bases de datos."""
     print_separator("TEST 1: Carga de Bases de Datos")
     
-    gestor = GestorBaseDatos(carpeta_datos='C:\git\perfiles-verificacion\database')
+    # Gestor compartido: la carpeta se resuelve con STEELCHECK_ROOT o la
+    # ruta relativa al módulo
+    gestor = obtener_gestor()
     
     # Verificar CIRSOC
     gestor.cambiar_base('CIRSOC')
@@ -68,8 +70,8 @@ def test_tipos_perfiles(gestor):
                 print(f"  Dimensiones: {resumen['altura']} x {resumen['ancho']}")
                 
                 # Mostrar columnas disponibles con valores no nulos
-                cols_con_datos = [col for col in datos.index 
-                                 if pd.notna(datos[col]) and col not in ['Tipo', 'PERFIL']]
+                cols_con_datos = [col for col in datos.index[datos.notna().to_numpy()]
+                                  if col not in COLUMNAS_NO_DATOS]
                 print(f"  Columnas con datos: {len(cols_con_datos)}")
                 
             except Exception as e:
@@ -171,6 +173,43 @@ def test_comparacion_bases(gestor):
     except Exception as e:
         print(f"\n⚠️  Error en AISC: {e}")
 
+def test_cache_propiedades(gestor):
+    """Test 7: Modificar un resultado no altera el cache de propiedades."""
+    print_separator("TEST 7: Aislamiento del Cache de Propiedades")
+    
+    import os, sys
+    _raiz = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    if _raiz not in sys.path:
+        sys.path.insert(0, _raiz)
+    from resistencia.compresion import compresion
+    
+    gestor.cambiar_base('CIRSOC')
+    r1 = compresion('200', 250, 3000, 3000, gestor, tipo_perfil='IPE',
+                    mostrar_calculo=False)
+    r1['propiedades']['flexion']['ry'] *= 2
+    r2 = compresion('200', 250, 3000, 3000, gestor, tipo_perfil='IPE',
+                    mostrar_calculo=False)
+    
+    print(f"\nIPE 200: Pd = {r1['Pd']:.2f} kN / {r2['Pd']:.2f} kN")
+    assert r2['propiedades'] is not r1['propiedades']
+    assert r2['Pd'] == r1['Pd'], "El resultado modificado alteró el cache"
+    print("  ✓ El resultado no comparte el dict cacheado")
+
+    # El dict del accessor tampoco es la entrada del cache
+    p1 = gestor.obtener_propiedades_perfil('200', tipo='IPE')
+    ry = p1['flexion']['ry']
+    p1['flexion']['ry'] *= 2
+    p1['disponibles'].clear()
+    p2 = gestor.obtener_propiedades_perfil('200', tipo='IPE')
+    r3 = compresion('200', 250, 3000, 3000, gestor, tipo_perfil='IPE',
+                    mostrar_calculo=False)
+
+    print(f"  ry = {p2['flexion']['ry']:.2f} mm, Pd = {r3['Pd']:.2f} kN")
+    assert p2['flexion'] is not p1['flexion'] and p2['disponibles']
+    assert p2['flexion']['ry'] == ry, "El dict del accessor alteró el cache"
+    assert r3['Pd'] == r1['Pd']
+    print("  ✓ obtener_propiedades_perfil entrega una copia")
+
 def main():
     """Ejecutar todos los tests."""
     print("\n" + "█"*70)
@@ -196,6 +235,9 @@ def main():
         # Test 6: Comparación entre bases
         test_comparacion_bases(gestor)
         
+        # Test 7: Cache de propiedades
+        test_cache_propiedades(gestor)
+        
         print_separator("RESUMEN")
         print("\n✓ Todos los tests completados exitosamente")
         print("\n" + "█"*70 + "\n")
@@ -4,14 +4,12 @@ test_utilidades_perfil.py
 Script de prueba para validar utilidades_perfil con nuevos tipos de perfiles.
 """
 
-import os
 import sys
 
 # Configurar rutas
 sys.path.insert(0, '/home/claude')
-os.environ['STEELCHECK_ROOT'] = 'C:\git\perfiles-verificacion'
 
-from gestor_base_datos import GestorBaseDatos
+from gestor_base_datos import obtener_gestor
 from utilidades_perfil import (
     extraer_propiedades, 
     imprimir_propiedades,
@@ -187,8 +185,8 @@ def main():
     print("█"*70)
     
     try:
-        # Inicializar gestor
-        gestor = GestorBaseDatos(carpeta_datos='C:\git\perfiles-verificacion\database')
+        # Gestor compartido (carpeta por STEELCHECK_ROOT o ruta relativa)
+        gestor = obtener_gestor()
         
         # Test 1: Familias
         test_familias()
@@ -32,9 +32,23 @@ Conversiones aplicadas por base de datos (verificadas cruzando rx=√(Ix/A)):
   ro, H         calculados               tabulados (C, MC, L)
 """
 
+import math
+import sys
+import threading
+import weakref
+
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:
+    # numba es opcional: sin él los kernels se ejecutan en Python puro
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda funcion: funcion
+
 
 # ============================================================================
 # FAMILIAS
@@ -50,6 +64,14 @@ FAMILIAS = {
     'TUBO_RECT'   : ['TUBO RECT.', 'HSS'],  # Se determina por bf: si bf > 0 → rect, sino cuad
 }
 
+# Índice inverso tipo → familia (primera familia que lo lista, como el
+# recorrido de FAMILIAS: 'HSS' sin más datos → TUBO_CUAD)
+_FAMILIA_POR_TIPO = {}
+for _familia, _tipos in FAMILIAS.items():
+    for _tipo in _tipos:
+        _FAMILIA_POR_TIPO.setdefault(_tipo, _familia)
+del _familia, _tipos, _tipo
+
 
 # ============================================================================
 # UTILIDADES GENERALES
@@ -57,11 +79,15 @@ FAMILIAS = {
 
 def a_flotante(valor, default: float = 0.0) -> float:
     """Conversión segura a float. Devuelve `default` ante NaN o strings."""
+    # Caso común (celda numérica): sin try ni np.isnan; NaN es el único
+    # float distinto de sí mismo
+    if type(valor) is float:
+        return valor if valor == valor else default
     try:
         v = float(valor)
-        return v if not np.isnan(v) else default
     except (ValueError, TypeError):
         return default
+    return v if v == v else default
 
 
 def determinar_familia(tipo: str, perfil: pd.Series = None) -> str:
@@ -73,30 +99,44 @@ def determinar_familia(tipo: str, perfil: pd.Series = None) -> str:
     """
     # HSS necesita lógica especial
     if tipo == 'HSS' and perfil is not None:
-        # Intentar determinar si es cuadrado o rectangular
-        # HSS tiene columna 'B' para ancho en AISC
-        try:
-            b_val = perfil.get('B', 0)
-            # Si no hay B o B=0, asumir que es de la otra familia (no importa cuál)
-            # Si hay B, verificar si es cuadrado (d ≈ B) o rectangular (d != B)
-            if b_val and b_val > 0:
-                d_val = perfil.get('d', 0)
-                # Tolerancia del 5% para considerar cuadrado
-                if abs(d_val - b_val) / max(d_val, b_val, 1) < 0.05:
-                    return 'TUBO_CUAD'
-                else:
-                    return 'TUBO_RECT'
-        except:
-            pass
-        # Default: probar con TUBO_CUAD primero
+        # Determinar si es cuadrado o rectangular: HSS tiene columna 'B'
+        # para el ancho en AISC. Sin B (o B=0) se asume cuadrado; con B se
+        # compara contra d con tolerancia del 5%.
+        b_val = a_flotante(perfil.get('B', 0))
+        if b_val > 0:
+            d_val = a_flotante(perfil.get('d', 0))
+            if abs(d_val - b_val) / max(d_val, b_val, 1) < 0.05:
+                return 'TUBO_CUAD'
+            return 'TUBO_RECT'
         return 'TUBO_CUAD'
     
-    # Otros tipos: búsqueda normal
-    for familia, tipos in FAMILIAS.items():
-        if tipo in tipos:
-            return familia
-    
-    return 'DESCONOCIDA'
+    # Otros tipos: búsqueda en el índice
+    return _FAMILIA_POR_TIPO.get(tipo, 'DESCONOCIDA')
+
+
+def determinar_familias(df: pd.DataFrame) -> pd.Series:
+    """
+    Familia de cada fila de una BD, con el mismo criterio que
+    determinar_familia. Pensada para calcularse una vez al cargar la BD y
+    guardarse como columna '_familia' (categórica).
+    """
+    tipos    = df['Tipo'].astype(str).str.strip()
+    familias = tipos.map(_FAMILIA_POR_TIPO).fillna('DESCONOCIDA').astype(object)
+    hss      = (tipos == 'HSS').to_numpy()
+    if hss.any():
+        # Regla de determinar_familia para HSS, en una pasada vectorizada
+        def _col(nombre):
+            if nombre not in df.columns:
+                return np.zeros(int(hss.sum()))
+            valores = pd.to_numeric(df.loc[hss, nombre], errors='coerce')
+            return valores.to_numpy(dtype=np.float64, na_value=0.0)
+        b_val = _col('B')
+        d_val = _col('d')
+        cuad  = (b_val <= 0) | (
+            np.abs(d_val - b_val) / np.maximum(np.maximum(d_val, b_val), 1) < 0.05
+        )
+        familias[hss] = np.where(cuad, 'TUBO_CUAD', 'TUBO_RECT')
+    return familias.astype('category')
 
 
 # ============================================================================
@@ -130,6 +170,8 @@ _MAPA_BASE = {
         'eo'    : ('eo',     10.0),
         'bf_2tf': ('bf/2tf',  1.0),
         'hw_tw' : ('hw/tw',   1.0),
+        'ro'    : None,              # calculado
+        'H'     : None,              # calculado
     },
     'AISC': {
         'area'  : ('A',       1.0),
@@ -153,6 +195,8 @@ _MAPA_BASE = {
         'eo'    : ('eo',      1.0),
         'bf_2tf': ('bf/2tf',  1.0),
         'hw_tw' : ('h/tw',    1.0),
+        'ro'    : ('ro',      1.0),  # tabulado (C, MC)
+        'H'     : ('H',       1.0),
     },
 }
 
@@ -250,7 +294,7 @@ _MAPA_TUBO = {
     'AISC': {
         # Intentar múltiples columnas para d, bf, t (diferentes entre PIPE y HSS)
         'd'     : [('Ht', 1.0), ('OD', 1.0)],  # HSS: Ht, PIPE: OD
-        'bf'    : [('B', 1.0)],                 # HSS: B
+        'bf'    : ('B',      1.0),              # HSS: B
         't'     : [('tdes', 1.0), ('t', 1.0)], # HSS: tdes, PIPE: t
         'area'  : ('A',      1.0),
         'peso'  : ('W',      1.0),
@@ -268,33 +312,179 @@ _MAPA_TUBO = {
 }
 
 
-def _leer(perfil: pd.Series, clave: str, bd: str,
-          mapa: dict = None, default: float = 0.0) -> float:
+def _compilar_mapa(entradas: dict) -> tuple:
+    """
+    Compilar el mapa de una BD a arrays, para leer todas sus claves de una
+    sola vez.
+
+    Returns (claves, columnas, alternativas, factores):
+        claves       : tuple con las claves del mapa
+        columnas     : list de columnas de la BD que se leen (sin repetir)
+        alternativas : int array (n_claves, n_alt), posición en `columnas`
+                       de cada alternativa, en orden; -1 = sin columna
+        factores     : float array (n_claves, n_alt) con los factores
+    """
+    claves   = tuple(entradas)
+    columnas = []
+    listas   = []
+    for entrada in entradas.values():
+        if entrada is None:
+            entrada = []
+        elif not isinstance(entrada, list):
+            entrada = [entrada]
+        for col, _ in entrada:
+            if col not in columnas:
+                columnas.append(col)
+        listas.append(entrada)
+
+    n_alt        = max(1, max(len(l) for l in listas))
+    alternativas = np.full((len(claves), n_alt), -1, dtype=np.intp)
+    factores     = np.ones((len(claves), n_alt))
+    for i, entrada in enumerate(listas):
+        for j, (col, factor) in enumerate(entrada):
+            alternativas[i, j] = columnas.index(col)
+            factores[i, j]     = factor
+    return claves, columnas, alternativas, factores
+
+
+# Mapas compilados por (nombre del mapa, BD)
+_MAPAS_COMPILADOS = {
+    (nombre, bd): _compilar_mapa(entradas)
+    for nombre, mapa in (('BASE', _MAPA_BASE), ('ANGULAR', _MAPA_ANGULAR),
+                         ('PERFIL_T', _MAPA_PERFIL_T), ('TUBO', _MAPA_TUBO))
+    for bd, entradas in mapa.items()
+}
+
+# Posiciones en la fila de cada alternativa, por mapa compilado (y de
+# 'Tipo' / '_familia', bajo la clave 'FIJAS'), para cada juego de columnas.
+# pd.Index no es hashable, así que se busca primero por id() con un weakref
+# que confirma el objeto (las filas de un DataFrame comparten su Index) y,
+# para un Index nuevo (un dict convertido, la otra BD), por la tupla de
+# columnas: filas AISC y CIRSOC alternadas no recalculan nada.
+_POSICIONES_POR_ID       = {}   # id(indice) → (weakref(indice), posiciones)
+_POSICIONES_POR_COLUMNAS = {}   # tuple(indice) → posiciones {clave: pos}
+_LOCK_POSICIONES = threading.Lock()
+
+
+def _posiciones_indice(indice: pd.Index) -> dict:
+    """Dict {clave: posiciones} compartido por todo Index con esas columnas."""
+    entrada = _POSICIONES_POR_ID.get(id(indice))
+    if entrada is not None and entrada[0]() is indice:
+        return entrada[1]
+    clave = id(indice)
+    with _LOCK_POSICIONES:
+        posiciones = _POSICIONES_POR_COLUMNAS.setdefault(tuple(indice), {})
+        # Al liberarse el Index se borra su entrada (su id puede reusarse)
+        ref = weakref.ref(indice, lambda _: _POSICIONES_POR_ID.pop(clave, None))
+        _POSICIONES_POR_ID[clave] = (ref, posiciones)
+    return posiciones
+
+
+def _posiciones(clave_mapa: tuple, indice: pd.Index) -> np.ndarray:
+    """Posiciones (n_claves, n_alt) en `indice`; len(indice) = sin columna."""
+    posiciones = _posiciones_indice(indice)
+    pos = posiciones.get(clave_mapa)
+    if pos is not None:
+        return pos
+    _, columnas, alternativas, _ = _MAPAS_COMPILADOS[clave_mapa]
+    en_fila = indice.get_indexer(columnas)
+    en_fila = np.where(en_fila < 0, len(indice), en_fila)
+    en_fila = np.append(en_fila, len(indice))        # alternativa -1
+    pos     = en_fila[alternativas]
+    # Dos hilos pueden calcularla a la vez: el resultado es el mismo
+    return posiciones.setdefault(clave_mapa, pos)
+
+
+def _posiciones_fijas(indice: pd.Index) -> tuple:
+    """Posiciones de 'Tipo' y '_familia' en `indice` (None si no están)."""
+    posiciones = _posiciones_indice(indice)
+    pos = posiciones.get('FIJAS')
+    if pos is not None:
+        return pos
+    pos = tuple(indice.get_loc(col) if col in indice else None
+                for col in ('Tipo', '_familia'))
+    return posiciones.setdefault('FIJAS', pos)
+
+
+def _leer_mapa(perfil: pd.Series, nombre_mapa: str, bd: str,
+               valores: np.ndarray = None) -> dict:
     """
-    Leer y convertir una propiedad del perfil usando el mapa indicado.
+    Leer y convertir todas las claves de un mapa para el perfil.
 
-    Devuelve `default` si la entrada del mapa es None o la columna no existe.
-    
-    Soporta múltiples columnas alternativas: si entrada es una lista,
-    intenta cada columna en orden hasta encontrar una con valor válido.
+    Cada clave toma la primera alternativa con valor numérico válido,
+    multiplicada por su factor. Claves sin columna (None), columnas
+    inexistentes, NaN o texto no numérico → 0.0.
+
+    valores: perfil.to_numpy(), si quien llama ya lo tiene.
     """
-    if mapa is None:
-        mapa = _MAPA_BASE
-    entrada = mapa[bd].get(clave)
-    if entrada is None:
-        return default
-    
-    # Soportar lista de alternativas: [(col1, factor1), (col2, factor2), ...]
-    if isinstance(entrada, list):
-        for col, factor in entrada:
-            valor = a_flotante(perfil.get(col, None), None)
-            if valor is not None:  # Encontró valor válido
-                return valor * factor
-        return default  # Ninguna alternativa tuvo valor
-    
-    # Entrada simple: (col, factor)
-    col, factor = entrada
-    return a_flotante(perfil.get(col, default), default) * factor
+    clave_mapa = (nombre_mapa, bd)
+    claves, _, _, factores = _MAPAS_COMPILADOS[clave_mapa]
+    pos = _posiciones(clave_mapa, perfil.index)
+
+    if valores is None:
+        valores = perfil.to_numpy()
+    crudos = np.append(valores, np.nan)[pos]
+    try:
+        valores = crudos.astype(np.float64)
+    except (ValueError, TypeError):
+        valores = np.vectorize(lambda v: a_flotante(v, np.nan), otypes=[np.float64])(crudos)
+    valores = valores * factores
+
+    resultado = valores[:, 0]
+    for j in range(1, valores.shape[1]):
+        resultado = np.where(np.isnan(resultado), valores[:, j], resultado)
+    resultado[np.isnan(resultado)] = 0.0
+    return dict(zip(claves, resultado.tolist()))
+
+
+def _leer_mapa_lote(df: pd.DataFrame, nombre_mapa: str, bd: str) -> np.ndarray:
+    """
+    Versión por lotes de _leer_mapa: matriz (n_filas, n_claves) con todas
+    las claves del mapa convertidas, columna por columna, para cada fila
+    de df. Mismas reglas: primera alternativa válida × factor; si no, 0.0.
+    """
+    _, columnas, alternativas, factores = _MAPAS_COMPILADOS[(nombre_mapa, bd)]
+
+    # Una columna extra de NaN para las alternativas sin columna (-1)
+    crudos = np.full((len(df), len(columnas) + 1), np.nan)
+    for j, col in enumerate(columnas):
+        if col in df.columns:
+            crudos[:, j] = pd.to_numeric(df[col], errors='coerce').to_numpy(
+                dtype=np.float64, na_value=np.nan)
+
+    valores   = crudos[:, alternativas] * factores
+    resultado = valores[:, :, 0]
+    for j in range(1, valores.shape[2]):
+        resultado = np.where(np.isnan(resultado), valores[:, :, j], resultado)
+    resultado[np.isnan(resultado)] = 0.0
+    return resultado
+
+
+# ============================================================================
+# KERNELS NUMÉRICOS
+# ============================================================================
+#
+# Cálculos escalares de centro de corte: se compilan con numba (modo
+# nopython) si está instalado, igual que los kernels de Q en
+# clasificacion_seccion. Reciben y devuelven floats.
+#
+
+@njit('UniTuple(float64, 3)(float64, float64, float64, float64, float64, '
+      'float64, float64)', cache=True)
+def _centro_corte_canal(x: float, eo: float, Ix: float, Iy: float, Ag: float,
+                        ro_tab: float, H_tab: float) -> tuple:
+    """
+    (xo, ro, H) de un canal.
+
+    Con ro y H tabulados (AISC C, MC) se usan directamente; si no
+    (CIRSOC, o faltan en la BD) se calculan con xo = |x - eo|.
+    """
+    if ro_tab > 0 and H_tab > 0:
+        return math.sqrt((1 - H_tab) * ro_tab**2), ro_tab, H_tab
+    xo = abs(x - eo)
+    ro = math.sqrt(xo**2 + (Ix + Iy) / Ag) if Ag > 0 else 0.0
+    H  = 1 - xo**2 / ro**2 if ro > 0 else 1.0
+    return xo, ro, H
 
 
 # ============================================================================
@@ -318,15 +508,361 @@ def extraer_propiedades(perfil: pd.Series, base_datos: str = 'CIRSOC') -> dict:
 
     Todas las magnitudes en mm / mm² / mm⁴ / mm⁶.
     """
-    bd   = base_datos.upper()
-    tipo = str(perfil['Tipo']).strip()
+    bd = base_datos.upper()
+
+    if not isinstance(perfil, pd.Series):
+        perfil = pd.Series(perfil)
+
+    # Acceso posicional: la fila se pasa a ndarray una sola vez y 'Tipo' /
+    # '_familia' se leen por posición (cacheada como las de los mapas)
+    valores = perfil.to_numpy()
+    pos_tipo, pos_familia = _posiciones_fijas(perfil.index)
+    if pos_tipo is None:
+        raise KeyError('Tipo')
+    # Internado: las tablas de despacho por tipo comparan por identidad
+    tipo = sys.intern(str(valores[pos_tipo]).strip())
 
     if bd not in ('CIRSOC', 'AISC'):
         raise ValueError(f"Base '{bd}' no reconocida. Use 'CIRSOC' o 'AISC'.")
 
+    # Familia precalculada por el gestor al cargar la BD, si está
+    familia = valores[pos_familia] if pos_familia is not None else None
+    if not isinstance(familia, str):
+        familia = determinar_familia(tipo, perfil)
+
+    return _armar_propiedades(tipo, familia, bd,
+                              lambda mapa: _leer_mapa(perfil, mapa, bd, valores))
+
+
+# ------------------------------------------------------------------ #
+# Armado por familia: cada handler completa las secciones de `props`  #
+# a partir de leer(nombre_mapa) → {clave: valor convertido}.          #
+# ------------------------------------------------------------------ #
+
+def _armar_doble_t(props: dict, bd: str, leer):
+    """DOBLE T: W, M, HP, S, IPE, IPN, IPB, IPBl, IPBv."""
+    # Atajos: todas las claves de un mapa se leen y convierten de una vez;
+    # _leer_mapa devuelve siempre todas las claves (0.0 si no hay dato)
+    R = leer('BASE').__getitem__
+
+    props['basicas'] = {
+        'd'   : R('d'),
+        'bf'  : R('bf'),
+        'Ag'  : R('area'),
+        'Peso': R('peso'),
+    }
+
+    props['flexion'] = {
+        'Ix': R('Ix'), 'Sx': R('Sx'), 'rx': R('rx'), 'Zx': R('Zx'),
+        'Iy': R('Iy'), 'Sy': R('Sy'), 'ry': R('ry'), 'Zy': R('Zy'),
+    }
+
+    props['torsion'] = {'J': R('J'), 'Cw': R('Cw')}
+
+    hw = R('hw_tw') * R('tw') if bd == 'AISC' else R('hw')
+
+    props['seccion'] = {
+        'tf'    : R('tf'),
+        'tw'    : R('tw'),
+        'hw'    : hw,
+        'bf_2tf': R('bf_2tf'),
+        'hw_tw' : R('hw_tw'),
+    }
+
+    Ag = props['basicas']['Ag']
+    Ix = props['flexion']['Ix']
+    Iy = props['flexion']['Iy']
+    props['centro_corte'] = {
+        'xo': 0.0,
+        'yo': 0.0,
+        'ro': math.sqrt((Ix + Iy) / Ag) if Ag > 0 else 0.0,
+        'H' : 1.0,
+    }
+
+    props['disponibles'] = [
+        'd', 'bf', 'tf', 'tw', 'hw', 'Ag',
+        'Ix', 'Iy', 'Sx', 'Sy', 'rx', 'ry', 'Zx', 'Zy', 'J', 'Cw',
+    ]
+
+
+def _armar_canal(props: dict, bd: str, leer):
+    """CANAL: C, MC, UPN."""
+    R = leer('BASE').__getitem__
+
+    props['basicas'] = {
+        'd'   : R('d'),
+        'bf'  : R('bf'),
+        'Ag'  : R('area'),
+        'Peso': R('peso'),
+    }
+
+    props['flexion'] = {
+        'Ix': R('Ix'), 'Sx': R('Sx'), 'rx': R('rx'), 'Zx': R('Zx'),
+        'Iy': R('Iy'), 'Sy': R('Sy'), 'ry': R('ry'), 'Zy': R('Zy'),
+    }
+
+    props['torsion'] = {'J': R('J'), 'Cw': R('Cw')}
+
+    tf  = R('tf')
+    tw  = R('tw')
+    hw  = R('hw_tw') * tw if bd == 'AISC' else R('hw')
+
+    bf_2tf = R('bf_2tf')
+    # AISC no precalcula bf/2tf para canales → calcular
+    if bf_2tf == 0.0 and R('bf') > 0 and tf > 0:
+        bf_2tf = R('bf') / (2 * tf)
+
+    props['seccion'] = {
+        'tf'    : tf,
+        'tw'    : tw,
+        'hw'    : hw,
+        'bf_2tf': bf_2tf,
+        'hw_tw' : R('hw_tw'),
+    }
+
+    x_mm  = R('x')
+    eo_mm = R('eo')
+    Ag    = props['basicas']['Ag']
+    Ix    = props['flexion']['Ix']
+    Iy    = props['flexion']['Iy']
+
+    # AISC tabula ro y H; CIRSOC se calcula siempre desde x y eo
+    # (xo = distancia del centroide al centro de corte)
+    if bd == 'AISC':
+        ro_tab, H_tab = R('ro'), R('H')
+    else:
+        ro_tab, H_tab = 0.0, 0.0
+    xo, ro, H = _centro_corte_canal(x_mm, eo_mm, Ix, Iy, Ag, ro_tab, H_tab)
+
+    props['centro_corte'] = {
+        'xo': xo,
+        'yo': 0.0,
+        'ro': ro,
+        'H' : H,
+        'x' : x_mm,
+        'eo': eo_mm,
+    }
+
+    props['disponibles'] = [
+        'd', 'bf', 'tf', 'tw', 'hw', 'Ag',
+        'Ix', 'Iy', 'Sx', 'Sy', 'rx', 'ry', 'Zx', 'Zy', 'J', 'Cw',
+        'x', 'eo',
+    ]
+
+
+def _armar_angular(props: dict, bd: str, leer):
+    """ANGULAR: L."""
+    R = leer('BASE').__getitem__
+    L = leer('ANGULAR').__getitem__
+
+    b  = L('b')
+    t  = L('t')
+    Ag = R('area')
+
+    Ix = L('Ix_ang')
+    Sx = L('Sx_ang')
+    rx = L('rx_ang')
+    Iv = L('Iv')
+    Sv = L('Sv')
+    iv = L('iv')
+    Iz = L('Iz')
+    iz = L('iz')
+
+    props['basicas'] = {
+        'b'   : b,
+        't'   : t,
+        'Ag'  : Ag,
+        'Peso': R('peso'),
+    }
+
+    props['flexion'] = {
+        'Ix': Ix, 'Sx': Sx, 'rx': rx,
+        'Iy': Ix, 'Sy': Sx, 'ry': rx,   # iguales en ángulo igual
+        'Iv': Iv, 'Sv': Sv, 'iv': iv,
+        'Iz': Iz, 'iz': iz,
+    }
+
+    props['torsion'] = {'J': R('J'), 'Cw': R('Cw')}
+
+    props['seccion'] = {
+        'b'  : b,
+        't'  : t,
+        'b_t': L('b_t'),
+    }
+
+    ex = L('ex_ey')
+    props['centro_corte'] = {
+        'ex': ex,
+        'ey': ex,
+        'xo': ex,
+        'yo': ex,
+        'ro': math.sqrt(2 * ex**2 + (Iv + Iz) / Ag) if Ag > 0 else 0.0,
+        'H' : None,
+    }
+
+    props['disponibles'] = [
+        'b', 't', 'Ag', 'Ix', 'rx', 'Iv', 'iv', 'Iz', 'J', 'Cw',
+    ]
+
+
+def _armar_perfil_t(props: dict, bd: str, leer):
+    """PERFIL T: T, WT, MT, ST."""
+    T = leer('PERFIL_T').__getitem__
+
+    props['basicas'] = {
+        'd'   : T('d'),
+        'bf'  : T('bf'),
+        'Ag'  : T('area'),
+        'Peso': T('peso'),
+    }
+
+    props['flexion'] = {
+        'Ix': T('Ix'), 'Sx': T('Sx'), 'rx': T('rx'), 'Zx': T('Zx'),
+        'Iy': T('Iy'), 'Sy': T('Sy'), 'ry': T('ry'), 'Zy': T('Zy'),
+    }
+
+    props['torsion'] = {'J': T('J'), 'Cw': T('Cw')}
+
+    props['seccion'] = {
+        'tf'    : T('tf'),
+        'tw'    : T('tw') if bd == 'AISC' else 0.0,
+        'bf_2tf': T('bf_2tf'),
+        'd_tw'  : T('d_tw'),
+    }
+
+    # Centro de corte: perfiles T tienen excentricidad
+    props['centro_corte'] = {
+        'xo': 0.0,
+        'yo': 0.0,
+        'ro': 0.0,
+        'H' : None,
+    }
+
+    props['disponibles'] = [
+        'd', 'bf', 'tf', 'Ag', 'Ix', 'Iy', 'Sx', 'Sy',
+        'rx', 'ry', 'Zx', 'Zy', 'J', 'Cw',
+    ]
+
+
+def _armar_tubo_simetrico(props: dict, bd: str, leer):
+    """
+    TUBOS CIRCULARES (TUBO CIRC., PIPE) y CUADRADOS (TUBO CUAD., HSS
+    cuadrado): Ix = Iy, centroide = centro de corte.
+    """
+    Tb = leer('TUBO').__getitem__
+
+    d  = Tb('d')     # diámetro exterior / lado del cuadrado
+    t  = Tb('t')     # espesor
+    Ag = Tb('area')
+
+    Ix = Tb('Ix')
+    Sx = Tb('Sx')
+    rx = Tb('rx')
+
+    props['basicas'] = {
+        'd'   : d,
+        't'   : t,
+        'Ag'  : Ag,
+        'Peso': Tb('peso'),
+    }
+
+    props['flexion'] = {
+        'Ix': Ix, 'Sx': Sx, 'rx': rx, 'Zx': Tb('Zx'),
+        'Iy': Ix, 'Sy': Sx, 'ry': rx, 'Zy': Tb('Zx'),  # simétrico
+    }
+
+    props['torsion'] = {'J': Tb('J'), 'Cw': Tb('Cw')}
+
+    props['seccion'] = {
+        'd'  : d,
+        't'  : t,
+        'd_t': d / t if t > 0 else 0.0,
+    }
+
+    props['centro_corte'] = {
+        'xo': 0.0,
+        'yo': 0.0,
+        'ro': rx,   # sección simétrica: ro ≈ rx
+        'H' : 1.0,  # sección doblemente simétrica
+    }
+
+    props['disponibles'] = [
+        'd', 't', 'Ag', 'Ix', 'rx', 'J', 'Cw',
+    ]
+
+
+def _armar_tubo_rect(props: dict, bd: str, leer):
+    """TUBOS RECTANGULARES: TUBO RECT., HSS rectangular."""
+    Tb = leer('TUBO').__getitem__
+
+    d  = Tb('d')     # altura
+    bf = Tb('bf')    # ancho
+    t  = Tb('t')     # espesor
+    Ag = Tb('area')
+
+    props['basicas'] = {
+        'd'   : d,
+        'bf'  : bf,
+        't'   : t,
+        'Ag'  : Ag,
+        'Peso': Tb('peso'),
+    }
+
+    props['flexion'] = {
+        'Ix': Tb('Ix'), 'Sx': Tb('Sx'), 'rx': Tb('rx'), 'Zx': Tb('Zx'),
+        'Iy': Tb('Iy'), 'Sy': Tb('Sy'), 'ry': Tb('ry'), 'Zy': Tb('Zy'),
+    }
+
+    props['torsion'] = {'J': Tb('J'), 'Cw': Tb('Cw')}
+
+    props['seccion'] = {
+        'd'  : d,
+        'bf' : bf,
+        't'  : t,
+        'd_t': d / t if t > 0 else 0.0,
+    }
+
+    props['centro_corte'] = {
+        'xo': 0.0,
+        'yo': 0.0,
+        'ro': math.sqrt(Tb('rx')**2 + Tb('ry')**2),
+        'H' : 1.0,
+    }
+
+    props['disponibles'] = [
+        'd', 'bf', 't', 'Ag', 'Ix', 'Iy', 'Sx', 'Sy',
+        'rx', 'ry', 'Zx', 'Zy', 'J', 'Cw',
+    ]
+
+
+_HANDLERS_PROPIEDADES = {
+    'DOBLE_T'   : _armar_doble_t,
+    'CANAL'     : _armar_canal,
+    'ANGULAR'   : _armar_angular,
+    'PERFIL_T'  : _armar_perfil_t,
+    'TUBO_CIRC' : _armar_tubo_simetrico,
+    'TUBO_CUAD' : _armar_tubo_simetrico,
+    'TUBO_RECT' : _armar_tubo_rect,
+}
+
+
+def _armar_propiedades(tipo: str, familia: str, bd: str, leer) -> dict:
+    """
+    Armar el dict de propiedades de un perfil a partir de sus mapas leídos.
+
+    leer(nombre_mapa) → dict {clave: valor convertido} del mapa indicado
+    ('BASE' | 'ANGULAR' | 'PERFIL_T' | 'TUBO') para este perfil.
+    """
+    handler = _HANDLERS_PROPIEDADES.get(familia)
+    if handler is None:
+        raise ValueError(
+            f"Tipo '{tipo}' no soportado. "
+            f"Válidos: {[t for ts in FAMILIAS.values() for t in ts]}"
+        )
+
     props = {
         'tipo'        : tipo,
-        'familia'     : determinar_familia(tipo, perfil),
+        'familia'     : familia,
         'basicas'     : {},
         'flexion'     : {},
         'torsion'     : {},
@@ -334,382 +870,185 @@ def extraer_propiedades(perfil: pd.Series, base_datos: str = 'CIRSOC') -> dict:
         'centro_corte': {},
         'disponibles' : [],
     }
+    handler(props, bd, leer)
+    return props
 
-    # Determinar familia una vez
-    familia = props['familia']
-    
-    # Atajos para no repetir bd en cada llamada
-    R = lambda clave, default=0.0: _leer(perfil, clave, bd, default=default)
-    L = lambda clave, default=0.0: _leer(perfil, clave, bd,
-                                          mapa=_MAPA_ANGULAR, default=default)
-
-    # ------------------------------------------------------------------ #
-    # DOBLE T: W, M, HP, S, IPE, IPN, IPB, IPBl, IPBv                    #
-    # ------------------------------------------------------------------ #
-    if familia == 'DOBLE_T':
 
-        props['basicas'] = {
-            'd'   : R('d'),
-            'bf'  : R('bf'),
-            'Ag'  : R('area'),
-            'Peso': R('peso'),
-        }
-
-        props['flexion'] = {
-            'Ix': R('Ix'), 'Sx': R('Sx'), 'rx': R('rx'), 'Zx': R('Zx'),
-            'Iy': R('Iy'), 'Sy': R('Sy'), 'ry': R('ry'), 'Zy': R('Zy'),
-        }
-
-        props['torsion'] = {'J': R('J'), 'Cw': R('Cw')}
-
-        hw = R('hw_tw') * R('tw') if bd == 'AISC' else R('hw')
-
-        props['seccion'] = {
-            'tf'    : R('tf'),
-            'tw'    : R('tw'),
-            'hw'    : hw,
-            'bf_2tf': R('bf_2tf'),
-            'hw_tw' : R('hw_tw'),
-        }
-
-        Ag = props['basicas']['Ag']
-        Ix = props['flexion']['Ix']
-        Iy = props['flexion']['Iy']
-        props['centro_corte'] = {
-            'xo': 0.0,
-            'yo': 0.0,
-            'ro': np.sqrt((Ix + Iy) / Ag) if Ag > 0 else 0.0,
-            'H' : 1.0,
-        }
-
-        props['disponibles'] = [
-            'd', 'bf', 'tf', 'tw', 'hw', 'Ag',
-            'Ix', 'Iy', 'Sx', 'Sy', 'rx', 'ry', 'Zx', 'Zy', 'J', 'Cw',
-        ]
-
-    # ------------------------------------------------------------------ #
-    # CANAL: C, MC, UPN                                                   #
-    # ------------------------------------------------------------------ #
-    elif familia == 'CANAL':
+def extraer_propiedades_batch(df: pd.DataFrame, base_datos: str = 'CIRSOC') -> list:
+    """
+    Extraer propiedades de todas las filas de una BD de una vez.
 
-        props['basicas'] = {
-            'd'   : R('d'),
-            'bf'  : R('bf'),
-            'Ag'  : R('area'),
-            'Peso': R('peso'),
-        }
+    Equivale a [extraer_propiedades(fila, base_datos) for fila in df], pero
+    cada mapa se lee y convierte por columnas para todo el lote (una
+    multiplicación por los factores sobre la matriz completa); por fila
+    sólo se arman los dicts.
 
-        props['flexion'] = {
-            'Ix': R('Ix'), 'Sx': R('Sx'), 'rx': R('rx'), 'Zx': R('Zx'),
-            'Iy': R('Iy'), 'Sy': R('Sy'), 'ry': R('ry'), 'Zy': R('Zy'),
-        }
+    Returns:
+    --------
+    list de dicts (mismo formato que extraer_propiedades), en el orden de
+    df. Las filas de un tipo no soportado quedan como None.
+    """
+    bd = base_datos.upper()
+    if bd not in ('CIRSOC', 'AISC'):
+        raise ValueError(f"Base '{bd}' no reconocida. Use 'CIRSOC' o 'AISC'.")
 
-        props['torsion'] = {'J': R('J'), 'Cw': R('Cw')}
+    tipos    = [sys.intern(str(t).strip()) for t in df['Tipo']]
+    familias = (df['_familia'] if '_familia' in df.columns
+                else determinar_familias(df)).tolist()
+
+    # Matrices convertidas de cada mapa, calculadas al primer uso
+    mapas = {}
+
+    def _filas(nombre_mapa):
+        if nombre_mapa not in mapas:
+            claves = _MAPAS_COMPILADOS[(nombre_mapa, bd)][0]
+            matriz = _leer_mapa_lote(df, nombre_mapa, bd)
+            mapas[nombre_mapa] = (claves, matriz.tolist())
+        return mapas[nombre_mapa]
+
+    resultado = []
+    for i, (tipo, familia) in enumerate(zip(tipos, familias)):
+        def leer(nombre_mapa, i=i):
+            claves, filas = _filas(nombre_mapa)
+            return dict(zip(claves, filas[i]))
+        try:
+            resultado.append(_armar_propiedades(tipo, familia, bd, leer))
+        except ValueError:
+            resultado.append(None)
+    return resultado
+
+
+def iter_extraer_propiedades(df: pd.DataFrame, base_datos: str = 'CIRSOC',
+                             tamano_lote: int = 256):
+    """
+    Generador de propiedades fila por fila para BDs grandes: procesa df en
+    lotes de `tamano_lote` filas con extraer_propiedades_batch y entrega
+    los dicts de a uno (None para tipos no soportados).
+
+    A diferencia de extraer_propiedades_batch no arma todos los dicts de
+    antemano: el consumidor puede cortar la iteración (ej. al encontrar el
+    primer perfil que verifica) y la memoria queda acotada a un lote.
+    """
+    if tamano_lote < 1:
+        raise ValueError(f"tamano_lote debe ser ≥ 1 (recibido: {tamano_lote}).")
+    for inicio in range(0, len(df), tamano_lote):
+        yield from extraer_propiedades_batch(df.iloc[inicio:inicio + tamano_lote],
+                                             base_datos)
+
+
+# Mapas que usa cada familia en _armar_propiedades
+_MAPAS_FAMILIA = {
+    'DOBLE_T'   : ('BASE',),
+    'CANAL'     : ('BASE',),
+    'ANGULAR'   : ('BASE', 'ANGULAR'),
+    'PERFIL_T'  : ('PERFIL_T',),
+    'TUBO_CIRC' : ('TUBO',),
+    'TUBO_CUAD' : ('TUBO',),
+    'TUBO_RECT' : ('TUBO',),
+}
+
+
+def extraer_propiedades_dataframe(df: pd.DataFrame, familia: str,
+                                  base_datos: str = 'CIRSOC') -> pd.DataFrame:
+    """
+    Tabla de propiedades convertidas a mm/mm²/mm⁴/mm⁶ para filas de una
+    misma familia, sin pasar por dicts.
+
+    Una columna por clave de los mapas de la familia (ej. 'area', 'Ix',
+    'hw_tw'; mismos valores que lee extraer_propiedades), con el index de
+    df, más los valores derivados que calcula extraer_propiedades ('hw',
+    'bf_2tf' de canales, 'd_t', 'xo', 'ro', 'H'), calculados en una pasada
+    sobre las columnas. Donde extraer_propiedades da None (H de angulares
+    y perfiles T) la columna es NaN.
+
+    Parámetros:
+    -----------
+    df         : pd.DataFrame — filas de la familia (ej. db[db['_familia'] == familia])
+    familia    : str          — clave de FAMILIAS
+    base_datos : str          — 'CIRSOC' | 'AISC'
+    """
+    bd = base_datos.upper()
+    if bd not in ('CIRSOC', 'AISC'):
+        raise ValueError(f"Base '{bd}' no reconocida. Use 'CIRSOC' o 'AISC'.")
+    if familia not in _MAPAS_FAMILIA:
+        raise ValueError(
+            f"Familia '{familia}' no soportada. Válidas: {list(_MAPAS_FAMILIA)}"
+        )
+
+    partes = [
+        pd.DataFrame(_leer_mapa_lote(df, nombre_mapa, bd),
+                     columns=list(_MAPAS_COMPILADOS[(nombre_mapa, bd)][0]),
+                     index=df.index)
+        for nombre_mapa in _MAPAS_FAMILIA[familia]
+    ]
+    tabla = pd.concat(partes, axis=1) if len(partes) > 1 else partes[0]
+    return _agregar_derivadas(tabla, familia, bd)
 
-        tf  = R('tf')
-        tw  = R('tw')
-        hw  = R('hw_tw') * tw if bd == 'AISC' else R('hw')
 
-        bf_2tf = R('bf_2tf')
+def _dividir(num, den) -> np.ndarray:
+    """num / den donde den > 0; 0.0 en el resto (sin warnings)."""
+    num = np.asarray(num, dtype=np.float64)
+    return np.divide(num, den, out=np.zeros_like(num), where=den > 0)
+
+
+def _agregar_derivadas(tabla: pd.DataFrame, familia: str, bd: str) -> pd.DataFrame:
+    """
+    Columnas derivadas de extraer_propiedades, con las mismas reglas que
+    _armar_propiedades pero sobre arrays completos de la familia.
+    """
+    c = {col: tabla[col].to_numpy() for col in tabla.columns}
+
+    if familia in ('DOBLE_T', 'CANAL'):
+        if bd == 'AISC':
+            tabla['hw'] = c['hw_tw'] * c['tw']
+
+    if familia == 'DOBLE_T':
+        tabla['xo'] = 0.0
+        tabla['ro'] = np.sqrt(_dividir(c['Ix'] + c['Iy'], c['area']))
+        tabla['H']  = 1.0
+
+    elif familia == 'CANAL':
         # AISC no precalcula bf/2tf para canales → calcular
-        if bf_2tf == 0.0 and R('bf') > 0 and tf > 0:
-            bf_2tf = R('bf') / (2 * tf)
-
-        props['seccion'] = {
-            'tf'    : tf,
-            'tw'    : tw,
-            'hw'    : hw,
-            'bf_2tf': bf_2tf,
-            'hw_tw' : R('hw_tw'),
-        }
-
-        x_mm  = R('x')
-        eo_mm = R('eo')
-        Ag    = props['basicas']['Ag']
-        Ix    = props['flexion']['Ix']
-        Iy    = props['flexion']['Iy']
+        falta = (c['bf_2tf'] == 0.0) & (c['bf'] > 0) & (c['tf'] > 0)
+        tabla['bf_2tf'] = np.where(falta, _dividir(c['bf'], 2 * c['tf']), c['bf_2tf'])
 
+        xo = np.abs(c['x'] - c['eo'])
+        ro = np.where(c['area'] > 0,
+                      np.sqrt(xo**2 + _dividir(c['Ix'] + c['Iy'], c['area'])), 0.0)
+        H  = np.where(ro > 0, 1 - _dividir(xo**2, ro**2), 1.0)
         if bd == 'AISC':
-            ro_tab = a_flotante(perfil.get('ro', 0))
-            H_tab  = a_flotante(perfil.get('H',  0))
-            if ro_tab > 0 and H_tab > 0:
-                ro = ro_tab
-                H  = H_tab
-                xo = np.sqrt((1 - H) * ro**2)
-            else:
-                # Fallback: calcular (raro, solo si faltan en BD)
-                xo = abs(x_mm - eo_mm)
-                ro = np.sqrt(xo**2 + (Ix + Iy) / Ag) if Ag > 0 else 0.0
-                H  = 1 - xo**2 / ro**2 if ro > 0 else 1.0
-        else:
-            # CIRSOC: xo = distancia del centroide al centro de corte
-            xo = abs(x_mm - eo_mm)
-            ro = np.sqrt(xo**2 + (Ix + Iy) / Ag) if Ag > 0 else 0.0
-            H  = 1 - xo**2 / ro**2 if ro > 0 else 1.0
-
-        props['centro_corte'] = {
-            'xo': xo,
-            'yo': 0.0,
-            'ro': ro,
-            'H' : H,
-            'x' : x_mm,
-            'eo': eo_mm,
-        }
-
-        props['disponibles'] = [
-            'd', 'bf', 'tf', 'tw', 'hw', 'Ag',
-            'Ix', 'Iy', 'Sx', 'Sy', 'rx', 'ry', 'Zx', 'Zy', 'J', 'Cw',
-            'x', 'eo',
-        ]
-
-    # ------------------------------------------------------------------ #
-    # ANGULAR: L                                                          #
-    # ------------------------------------------------------------------ #
+            # ro y H tabulados cuando están; si no, calculados como CIRSOC
+            tab = (c['ro'] > 0) & (c['H'] > 0)
+            with np.errstate(invalid='ignore'):
+                xo_tab = np.sqrt((1 - c['H']) * c['ro']**2)
+            xo = np.where(tab, xo_tab, xo)
+            ro = np.where(tab, c['ro'], ro)
+            H  = np.where(tab, c['H'], H)
+        tabla['xo'] = xo
+        tabla['ro'] = ro
+        tabla['H']  = H
+
     elif familia == 'ANGULAR':
+        ex = c['ex_ey']
+        tabla['xo'] = ex
+        tabla['ro'] = np.where(c['area'] > 0,
+                               np.sqrt(2 * ex**2 + _dividir(c['Iv'] + c['Iz'], c['area'])),
+                               0.0)
+        tabla['H']  = np.nan      # extraer_propiedades: H = None
 
-        b  = L('b')
-        t  = L('t')
-        Ag = R('area')
-
-        Ix = L('Ix_ang')
-        Sx = L('Sx_ang')
-        rx = L('rx_ang')
-        Iv = L('Iv')
-        Sv = L('Sv')
-        iv = L('iv')
-        Iz = L('Iz')
-        iz = L('iz')
-
-        props['basicas'] = {
-            'b'   : b,
-            't'   : t,
-            'Ag'  : Ag,
-            'Peso': R('peso'),
-        }
-
-        props['flexion'] = {
-            'Ix': Ix, 'Sx': Sx, 'rx': rx,
-            'Iy': Ix, 'Sy': Sx, 'ry': rx,   # iguales en ángulo igual
-            'Iv': Iv, 'Sv': Sv, 'iv': iv,
-            'Iz': Iz, 'iz': iz,
-        }
-
-        props['torsion'] = {'J': R('J'), 'Cw': R('Cw')}
-
-        props['seccion'] = {
-            'b'  : b,
-            't'  : t,
-            'b_t': L('b_t'),
-        }
-
-        ex = L('ex_ey')
-        props['centro_corte'] = {
-            'ex': ex,
-            'ey': ex,
-            'xo': ex,
-            'yo': ex,
-            'ro': np.sqrt(2 * ex**2 + (Iv + Iz) / Ag) if Ag > 0 else 0.0,
-            'H' : None,
-        }
-
-        props['disponibles'] = [
-            'b', 't', 'Ag', 'Ix', 'rx', 'Iv', 'iv', 'Iz', 'J', 'Cw',
-        ]
-
-    # ------------------------------------------------------------------ #
-    # PERFIL T: T, WT, MT, ST                                             #
-    # ------------------------------------------------------------------ #
     elif familia == 'PERFIL_T':
-        
-        # Atajo para perfiles T
-        T = lambda clave, default=0.0: _leer(perfil, clave, bd,
-                                              mapa=_MAPA_PERFIL_T, default=default)
-        
-        props['basicas'] = {
-            'd'   : T('d'),
-            'bf'  : T('bf'),
-            'Ag'  : T('area'),
-            'Peso': T('peso'),
-        }
-        
-        props['flexion'] = {
-            'Ix': T('Ix'), 'Sx': T('Sx'), 'rx': T('rx'), 'Zx': T('Zx'),
-            'Iy': T('Iy'), 'Sy': T('Sy'), 'ry': T('ry'), 'Zy': T('Zy'),
-        }
-        
-        props['torsion'] = {'J': T('J'), 'Cw': T('Cw')}
-        
-        props['seccion'] = {
-            'tf'    : T('tf'),
-            'tw'    : T('tw') if bd == 'AISC' else 0.0,
-            'bf_2tf': T('bf_2tf'),
-            'd_tw'  : T('d_tw'),
-        }
-        
-        # Centro de corte: perfiles T tienen excentricidad
-        props['centro_corte'] = {
-            'xo': 0.0,
-            'yo': 0.0,
-            'ro': 0.0,
-            'H' : None,
-        }
-        
-        props['disponibles'] = [
-            'd', 'bf', 'tf', 'Ag', 'Ix', 'Iy', 'Sx', 'Sy', 
-            'rx', 'ry', 'Zx', 'Zy', 'J', 'Cw',
-        ]
-
-    # ------------------------------------------------------------------ #
-    # TUBOS CIRCULARES: TUBO CIRC., PIPE                                 #
-    # ------------------------------------------------------------------ #
-    elif familia == 'TUBO_CIRC':
-        
-        # Atajo para tubos
-        Tb = lambda clave, default=0.0: _leer(perfil, clave, bd,
-                                               mapa=_MAPA_TUBO, default=default)
-        
-        d  = Tb('d')     # diámetro exterior
-        t  = Tb('t')     # espesor
-        Ag = Tb('area')
-        
-        # Tubos circulares: Ix = Iy
-        Ix = Tb('Ix')
-        Sx = Tb('Sx')
-        rx = Tb('rx')
-        
-        props['basicas'] = {
-            'd'   : d,
-            't'   : t,
-            'Ag'  : Ag,
-            'Peso': Tb('peso'),
-        }
-        
-        props['flexion'] = {
-            'Ix': Ix, 'Sx': Sx, 'rx': rx, 'Zx': Tb('Zx'),
-            'Iy': Ix, 'Sy': Sx, 'ry': rx, 'Zy': Tb('Zx'),  # simétrico
-        }
-        
-        props['torsion'] = {'J': Tb('J'), 'Cw': Tb('Cw')}
-        
-        props['seccion'] = {
-            'd'  : d,
-            't'  : t,
-            'd_t': d / t if t > 0 else 0.0,
-        }
-        
-        props['centro_corte'] = {
-            'xo': 0.0,  # centroide = centro de corte
-            'yo': 0.0,
-            'ro': rx,   # para sección circular ro ≈ rx
-            'H' : 1.0,  # sección doblemente simétrica
-        }
-        
-        props['disponibles'] = [
-            'd', 't', 'Ag', 'Ix', 'rx', 'J', 'Cw',
-        ]
-
-    # ------------------------------------------------------------------ #
-    # TUBOS CUADRADOS: TUBO CUAD.                                        #
-    # ------------------------------------------------------------------ #
-    elif familia == 'TUBO_CUAD':
-        
-        Tb = lambda clave, default=0.0: _leer(perfil, clave, bd,
-                                               mapa=_MAPA_TUBO, default=default)
-        
-        d  = Tb('d')     # lado del cuadrado
-        t  = Tb('t')     # espesor
-        Ag = Tb('area')
-        
-        # Tubos cuadrados: Ix = Iy
-        Ix = Tb('Ix')
-        Sx = Tb('Sx')
-        rx = Tb('rx')
-        
-        props['basicas'] = {
-            'd'   : d,
-            't'   : t,
-            'Ag'  : Ag,
-            'Peso': Tb('peso'),
-        }
-        
-        props['flexion'] = {
-            'Ix': Ix, 'Sx': Sx, 'rx': rx, 'Zx': Tb('Zx'),
-            'Iy': Ix, 'Sy': Sx, 'ry': rx, 'Zy': Tb('Zx'),  # simétrico
-        }
-        
-        props['torsion'] = {'J': Tb('J'), 'Cw': Tb('Cw')}
-        
-        props['seccion'] = {
-            'd'  : d,
-            't'  : t,
-            'd_t': d / t if t > 0 else 0.0,
-        }
-        
-        props['centro_corte'] = {
-            'xo': 0.0,
-            'yo': 0.0,
-            'ro': rx,
-            'H' : 1.0,
-        }
-        
-        props['disponibles'] = [
-            'd', 't', 'Ag', 'Ix', 'rx', 'J', 'Cw',
-        ]
-
-    # ------------------------------------------------------------------ #
-    # TUBOS RECTANGULARES: TUBO RECT.                                    #
-    # ------------------------------------------------------------------ #
-    elif familia == 'TUBO_RECT':
-        
-        Tb = lambda clave, default=0.0: _leer(perfil, clave, bd,
-                                               mapa=_MAPA_TUBO, default=default)
-        
-        d  = Tb('d')     # altura
-        bf = Tb('bf')    # ancho
-        t  = Tb('t')     # espesor
-        Ag = Tb('area')
-        
-        props['basicas'] = {
-            'd'   : d,
-            'bf'  : bf,
-            't'   : t,
-            'Ag'  : Ag,
-            'Peso': Tb('peso'),
-        }
-        
-        props['flexion'] = {
-            'Ix': Tb('Ix'), 'Sx': Tb('Sx'), 'rx': Tb('rx'), 'Zx': Tb('Zx'),
-            'Iy': Tb('Iy'), 'Sy': Tb('Sy'), 'ry': Tb('ry'), 'Zy': Tb('Zy'),
-        }
-        
-        props['torsion'] = {'J': Tb('J'), 'Cw': Tb('Cw')}
-        
-        props['seccion'] = {
-            'd'  : d,
-            'bf' : bf,
-            't'  : t,
-            'd_t': d / t if t > 0 else 0.0,
-        }
-        
-        props['centro_corte'] = {
-            'xo': 0.0,
-            'yo': 0.0,
-            'ro': np.sqrt(Tb('rx')**2 + Tb('ry')**2),
-            'H' : 1.0,
-        }
-        
-        props['disponibles'] = [
-            'd', 'bf', 't', 'Ag', 'Ix', 'Iy', 'Sx', 'Sy', 
-            'rx', 'ry', 'Zx', 'Zy', 'J', 'Cw',
-        ]
+        tabla['xo'] = 0.0
+        tabla['ro'] = 0.0
+        tabla['H']  = np.nan      # extraer_propiedades: H = None
 
-    else:
-        raise ValueError(
-            f"Tipo '{tipo}' no soportado. "
-            f"Válidos: {[t for ts in FAMILIAS.values() for t in ts]}"
-        )
+    else:  # tubos
+        tabla['d_t'] = _dividir(c['d'], c['t'])
+        tabla['xo']  = 0.0
+        tabla['ro']  = (np.sqrt(c['rx']**2 + c['ry']**2) if familia == 'TUBO_RECT'
+                        else c['rx'])
+        tabla['H']   = 1.0
 
-    return props
+    return tabla
 
 
 # ============================================================================
@@ -717,23 +1056,23 @@ def extraer_propiedades(perfil: pd.Series, base_datos: str = 'CIRSOC') -> dict:
 # ============================================================================
 
 _REQUERIDAS = {
-    'DOBLE_T'   : ['d', 'bf', 'tf', 'tw', 'hw', 'Ag', 'Ix', 'Iy', 'rx', 'ry'],
-    'CANAL'     : ['d', 'bf', 'tf', 'tw', 'hw', 'Ag', 'Ix', 'Iy', 'rx', 'ry'],
-    'ANGULAR'   : ['b', 't', 'Ag', 'Ix', 'rx'],
-    'PERFIL_T'  : ['d', 'bf', 'tf', 'Ag', 'Ix', 'Iy', 'rx', 'ry'],
-    'TUBO_CIRC' : ['d', 't', 'Ag', 'Ix', 'rx'],
-    'TUBO_CUAD' : ['d', 't', 'Ag', 'Ix', 'rx'],
-    'TUBO_RECT' : ['d', 'bf', 't', 'Ag', 'Ix', 'Iy', 'rx', 'ry'],
+    'DOBLE_T'   : ('d', 'bf', 'tf', 'tw', 'hw', 'Ag', 'Ix', 'Iy', 'rx', 'ry'),
+    'CANAL'     : ('d', 'bf', 'tf', 'tw', 'hw', 'Ag', 'Ix', 'Iy', 'rx', 'ry'),
+    'ANGULAR'   : ('b', 't', 'Ag', 'Ix', 'rx'),
+    'PERFIL_T'  : ('d', 'bf', 'tf', 'Ag', 'Ix', 'Iy', 'rx', 'ry'),
+    'TUBO_CIRC' : ('d', 't', 'Ag', 'Ix', 'rx'),
+    'TUBO_CUAD' : ('d', 't', 'Ag', 'Ix', 'rx'),
+    'TUBO_RECT' : ('d', 'bf', 't', 'Ag', 'Ix', 'Iy', 'rx', 'ry'),
 }
 
 _OPCIONALES_IMPORTANTES = {
-    'DOBLE_T'   : ['J', 'Cw'],
-    'CANAL'     : ['J', 'Cw', 'x', 'eo'],
-    'ANGULAR'   : ['J', 'Cw'],
-    'PERFIL_T'  : ['J', 'Cw'],
-    'TUBO_CIRC' : ['J'],
-    'TUBO_CUAD' : ['J'],
-    'TUBO_RECT' : ['J'],
+    'DOBLE_T'   : ('J', 'Cw'),
+    'CANAL'     : ('J', 'Cw', 'x', 'eo'),
+    'ANGULAR'   : ('J', 'Cw'),
+    'PERFIL_T'  : ('J', 'Cw'),
+    'TUBO_CIRC' : ('J',),
+    'TUBO_CUAD' : ('J',),
+    'TUBO_RECT' : ('J',),
 }
 
 
@@ -744,21 +1083,20 @@ def verificar_propiedades(props: dict) -> dict:
     Returns dict: 'completo' [bool], 'faltantes' [list], 'advertencias' [list]
     """
     familia     = props.get('familia', 'DESCONOCIDA')
-    disponibles = props.get('disponibles', [])
-    resultado   = {'completo': True, 'faltantes': [], 'advertencias': []}
-
-    for prop in _REQUERIDAS.get(familia, []):
-        if prop not in disponibles:
-            resultado['faltantes'].append(prop)
-            resultado['completo'] = False
-
-    for prop in _OPCIONALES_IMPORTANTES.get(familia, []):
-        if prop not in disponibles:
-            resultado['advertencias'].append(
-                f"'{prop}' no disponible — puede limitar el cálculo."
-            )
-
-    return resultado
+    disponibles = frozenset(props.get('disponibles', ()))
+
+    faltantes = [p for p in _REQUERIDAS.get(familia, ()) if p not in disponibles]
+    advertencias = [
+        f"'{p}' no disponible — puede limitar el cálculo."
+        for p in _OPCIONALES_IMPORTANTES.get(familia, ())
+        if p not in disponibles
+    ]
+
+    return {
+        'completo'    : not faltantes,
+        'faltantes'   : faltantes,
+        'advertencias': advertencias,
+    }
 
 
 # ============================================================================
@@ -850,15 +1188,19 @@ def formatear_para_display(props: dict, decimales: int = 2) -> dict:
         """
         if valor is None:
             return None, '—'
-        # Aceptar numpy scalars y Python int/float
-        try:
+        # numpy scalars y Python int/float van directo; el resto (texto
+        # numérico) se intenta convertir y, si no se puede, pasa tal cual
+        if isinstance(valor, (float, int, np.floating, np.integer)):
             valor = float(valor)
-            if np.isnan(valor):
-                return None, '—'
-        except (TypeError, ValueError):
-            return valor, '—'
+        else:
+            try:
+                valor = float(valor)
+            except (TypeError, ValueError):
+                return valor, '—'
+        if valor != valor:          # NaN
+            return None, '—'
         unidad, factor = _DISPLAY_UNIDADES.get(clave, ('—', 1.0))
-        return round(float(valor * factor), decimales), unidad
+        return round(valor * factor, decimales), unidad
 
     display = {
         'tipo'   : props['tipo'],
@@ -23,6 +23,7 @@ Unidades internas : mm / mm² / mm⁴ / MPa / N
 Unidades de salida: kN (fuerzas), MPa (tensiones), cm² (área en reporte)
 """
 
+import math
 import numpy as np
 import sys
 import os
@@ -31,8 +32,17 @@ _raiz_python = os.path.normpath(os.path.join(os.path.dirname(__file__), '..'))
 if _raiz_python not in sys.path:
     sys.path.insert(0, _raiz_python)
 
-from core.utilidades_perfil import extraer_propiedades, verificar_propiedades
-from clasificacion.clasificacion_seccion import clasificar_seccion, calcular_Q
+from core.utilidades_perfil import verificar_propiedades
+from clasificacion.clasificacion_seccion import (
+    clasificar_seccion, calcular_Q,
+    propiedades_a_soa, clasificar_secciones_batch, calcular_Q_batch,
+)
+
+try:
+    from numba import vectorize
+except ImportError:
+    # numba es opcional: sin él _calcular_Fcr_batch usa np.where
+    vectorize = None
 
 
 # ============================================================================
@@ -43,6 +53,8 @@ E_ACERO = 200_000   # MPa
 G_ACERO =  77_200   # MPa
 PHI_C   =    0.90   # Factor de reducción LRFD compresión
 
+_PI2_E  = math.pi**2 * E_ACERO   # π²·E, común a todas las Fe
+
 
 # ============================================================================
 # FUNCIONES DE Fe
@@ -51,7 +63,7 @@ PHI_C   =    0.90   # Factor de reducción LRFD compresión
 def _fe_flexional(KL: float, r: float) -> tuple[float, float]:
     """Fe por pandeo flexional: π²·E / (KL/r)²  → (Fe [MPa], esbeltez)"""
     esbeltez = KL / r
-    return np.pi**2 * E_ACERO / esbeltez**2, esbeltez
+    return _PI2_E / (esbeltez * esbeltez), esbeltez
 
 
 def _fe_torsional(J: float, Cw: float, Kz: float, Lz: float,
@@ -61,7 +73,8 @@ def _fe_torsional(J: float, Cw: float, Kz: float, Lz: float,
     Fe_z = (π²·E·Cw / (Kz·Lz)² + G·J) / (Ag·ro²)
     Ref: AISC 360-10 E4-4
     """
-    return (np.pi**2 * E_ACERO * Cw / (Kz * Lz)**2 + G_ACERO * J) / (Ag * ro**2)
+    KzLz = Kz * Lz
+    return (_PI2_E * Cw / (KzLz * KzLz) + G_ACERO * J) / (Ag * (ro * ro))
 
 
 def _fe_flexotorsional_canal(Fe_y: float, Fe_z: float, H: float) -> float:
@@ -84,6 +97,26 @@ def _calcular_Fcr(Fe: float, Fy: float, Q: float = 1.0) -> float:
     return (0.658 ** ratio) * QFy if ratio <= 2.25 else 0.877 * Fe
 
 
+# Con numba, _calcular_Fcr compilado como ufunc real (broadcasting y
+# bucle en código máquina, con la misma rama que la versión escalar)
+_FCR_UFUNC = (vectorize(['float64(float64, float64, float64)'], cache=True)(_calcular_Fcr)
+              if vectorize is not None else None)
+
+
+def _calcular_Fcr_batch(Fe, Fy, Q=1.0) -> np.ndarray:
+    """
+    Versión vectorizada de _calcular_Fcr: Fe, Fy y Q escalares o arrays
+    (se combinan por broadcasting), p. ej. un Fe por perfil y longitud.
+    Mismas ecuaciones, sin rama por elemento.
+    """
+    if _FCR_UFUNC is not None:
+        return _FCR_UFUNC(Fe, Fy, Q)
+    Fe    = np.asarray(Fe, dtype=np.float64)
+    QFy   = np.multiply(Q, Fy, dtype=np.float64)
+    ratio = QFy / Fe
+    return np.where(ratio <= 2.25, np.power(0.658, ratio) * QFy, 0.877 * Fe)
+
+
 # ============================================================================
 # FUNCIÓN PRINCIPAL
 # ============================================================================
@@ -150,16 +183,16 @@ def compresion(perfil_nombre: str,
     # PASO 1: OBTENER DATOS DEL PERFIL                                   #
     # ================================================================== #
 
-    perfil    = db_manager.obtener_datos_perfil(perfil_nombre, tipo=tipo_perfil)
     bd_nombre = db_manager.nombre_base_activa()
-    tipo      = str(perfil['Tipo']).strip()
     latex_doc.append(f"\\text{{Base de datos: {bd_nombre}}}")
 
     # ================================================================== #
     # PASO 2: EXTRAER PROPIEDADES (todo en mm / mm² / mm⁴)               #
     # ================================================================== #
 
-    props        = extraer_propiedades(perfil, base_datos=bd_nombre)
+    # Extraídas una vez por perfil y cacheadas en el gestor (copia propia)
+    props        = db_manager.obtener_propiedades_perfil(perfil_nombre, tipo=tipo_perfil)
+    tipo         = props['tipo']
     familia      = props['familia']   # DOBLE_T | CANAL | ANGULAR | DESCONOCIDA
     verificacion = verificar_propiedades(props)
 
@@ -279,7 +312,8 @@ def compresion(perfil_nombre: str,
             Fcr_temporal = _calcular_Fcr(Fe_temp, Fy, Q=Q_actual)
             
             # Calcular nuevo Q usando Fcr temporal
-            Q_info = calcular_Q(props, Fy, E_ACERO, Fcr=Fcr_temporal)
+            Q_info = calcular_Q(props, Fy, E_ACERO, Fcr=Fcr_temporal,
+                                clasificacion=clasificacion)
             Q_nuevo = Q_info['Q']
             Qs = Q_info['Qs']
             Qa = Q_info['Qa']
@@ -469,6 +503,180 @@ def compresion(perfil_nombre: str,
     return resultados
 
 
+# ============================================================================
+# COMPRESIÓN EN LOTE (VECTORIZADO)
+# ============================================================================
+
+_FAMILIAS_COMPRESION = ('DOBLE_T', 'CANAL', 'ANGULAR')
+
+
+def compresion_batch(perfiles: list,
+                     Fy,
+                     Lx,
+                     Ly,
+                     Lz=None,
+                     Kx=1.0,
+                     Ky=1.0,
+                     Kz=1.0,
+                     max_iter_Q: int = 5,
+                     tol_Q: float = 0.01) -> dict:
+    """
+    Resistencia a compresión de N perfiles de una sola vez, con arrays.
+
+    Mismas ecuaciones que compresion() (modos de pandeo por familia,
+    iteración de Q para secciones esbeltas, Fcr, Pn, Pd), sin reporte,
+    LaTeX ni advertencias, y sin redondear. Pensada para barridos de
+    perfiles y/o longitudes.
+
+    Parámetros:
+    -----------
+    perfiles   : list[dict]    — salidas de extraer_propiedades() (ej. de
+                                 extraer_propiedades_batch()); familias
+                                 DOBLE_T, CANAL o ANGULAR
+    Fy         : float | array — tensión de fluencia [MPa]
+    Lx, Ly     : float | array — longitudes de pandeo [mm]
+    Lz         : float | array — longitud torsional [mm] (default: max(Lx, Ly))
+    Kx, Ky, Kz : float | array — factores de longitud efectiva
+    max_iter_Q : int           — máx. iteraciones de Q
+    tol_Q      : float         — tolerancia relativa de Q
+
+    Los escalares y arrays (N,) se combinan por broadcasting.
+
+    Returns:
+    --------
+    dict de np.ndarray (N,):
+        'familia', 'modo_pandeo', 'clase_seccion' (str)
+        'Fe', 'Fcr' [MPa], 'Pn', 'Pd' [kN], 'Q', 'Qs', 'Qa', 'esbeltez_max'
+        'iter_Q' (int, 0 si la sección no es esbelta)
+    """
+    n = len(perfiles)
+
+    for p in perfiles:
+        if p['familia'] not in _FAMILIAS_COMPRESION:
+            raise ValueError(
+                f"Familia '{p['familia']}' no implementada en pandeo global. "
+                f"Tipos soportados: DOBLE_T, CANAL, ANGULAR."
+            )
+        verificacion = verificar_propiedades(p)
+        if not verificacion['completo']:
+            raise ValueError(
+                f"Perfil '{p['tipo']}' sin propiedades necesarias. "
+                f"Faltantes: {', '.join(verificacion['faltantes'])}"
+            )
+
+    def _col(grupo, clave, default=0.0):
+        valores = [p[grupo].get(clave, default) for p in perfiles]
+        return np.array([np.nan if v is None else v for v in valores], dtype=float)
+
+    familia = np.array([p['familia'] for p in perfiles], dtype=object)
+    A  = _col('basicas', 'Ag')
+    rx = _col('flexion', 'rx')
+    ry = _col('flexion', 'ry')
+    iv = _col('flexion', 'iv', np.nan)
+    J  = _col('torsion', 'J')
+    Cw = _col('torsion', 'Cw')
+    xo = _col('centro_corte', 'xo')
+    ro = _col('centro_corte', 'ro')
+    H  = _col('centro_corte', 'H')
+
+    def _vec(valor):
+        return np.broadcast_to(np.asarray(valor, dtype=float), (n,))
+
+    Fy, Lx, Ly = _vec(Fy), _vec(Lx), _vec(Ly)
+    Lz = np.maximum(Lx, Ly) if Lz is None else _vec(Lz)
+    KxLx = _vec(Kx) * Lx
+    KyLy = _vec(Ky) * Ly
+    Kz   = _vec(Kz)
+
+    es_doble_t = familia == 'DOBLE_T'
+    es_canal   = familia == 'CANAL'
+
+    # ------------------------------------------------------------------ #
+    # Pandeo global: todos los modos para todos, luego se elige por familia
+    # ------------------------------------------------------------------ #
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Fe_x, esb_x = _fe_flexional(KxLx, rx)
+        Fe_y, esb_y = _fe_flexional(KyLy, ry)
+        Fe_z        = _fe_torsional(J, Cw, Kz, Lz, A, ro)
+
+        # Canal: flexo-torsional si hay xo y H; si no, Fe_y (conservador)
+        usa_yzt = es_canal & (H > 0) & (xo > 0)
+        Fe_yzt  = np.where(usa_yzt, _fe_flexotorsional_canal(Fe_y, Fe_z, H), Fe_y)
+
+        Fe_iv, esb_iv = _fe_flexional(np.maximum(np.maximum(KxLx, KyLy), Kz * Lz), iv)
+
+    # Mínimo por familia; ante empate gana el primer modo, como en compresion()
+    modos_doble_t = np.stack([Fe_x, Fe_y, Fe_z])
+    modos_canal   = np.stack([Fe_x, Fe_yzt])
+    i_doble_t     = np.argmin(modos_doble_t, axis=0)
+    i_canal       = np.argmin(modos_canal, axis=0)
+    columnas      = np.arange(n)
+
+    Fe = np.select(
+        [es_doble_t, es_canal],
+        [modos_doble_t[i_doble_t, columnas], modos_canal[i_canal, columnas]],
+        default=Fe_iv,
+    )
+    modo_pandeo = np.select(
+        [es_doble_t, es_canal],
+        [np.array(['Flexional_X', 'Flexional_Y', 'Torsional_Z'], dtype=object)[i_doble_t],
+         np.array(['Flexional_X', 'Flexo_torsional_YZ'], dtype=object)[i_canal]],
+        default='Flexional_iv',
+    )
+    esbeltez_max = np.where(es_doble_t | es_canal, np.maximum(esb_x, esb_y), esb_iv)
+
+    # ------------------------------------------------------------------ #
+    # Clasificación y Q (iteración sólo para las esbeltas)               #
+    # ------------------------------------------------------------------ #
+    soa           = propiedades_a_soa(perfiles)
+    clasificacion = clasificar_secciones_batch(soa, Fy, E_ACERO)
+    es_esbelta    = clasificacion['es_esbelta']
+
+    Q_actual = np.ones(n)
+    Q  = np.ones(n)
+    Qs = np.ones(n)
+    Qa = np.ones(n)
+    iter_Q = np.zeros(n, dtype=int)
+    activo = es_esbelta.copy()
+
+    for iteracion in range(1, max_iter_Q + 1):
+        if not activo.any():
+            break
+        Fcr_temporal = _calcular_Fcr_batch(Fe, Fy, Q_actual)
+        Q_info = calcular_Q_batch(soa, Fy, E_ACERO, Fcr=Fcr_temporal,
+                                  clasificacion=clasificacion)
+        Q  = np.where(activo, Q_info['Q'],  Q)
+        Qs = np.where(activo, Q_info['Qs'], Qs)
+        Qa = np.where(activo, Q_info['Qa'], Qa)
+        iter_Q = np.where(activo, iteracion, iter_Q)
+
+        error = np.where(Q_actual > 0, np.abs(Q - Q_actual) / Q_actual, 1.0)
+        activo &= ~(error < tol_Q)
+        Q_actual = np.where(activo, Q, Q_actual)
+
+    # ------------------------------------------------------------------ #
+    # Fcr, Pn, Pd                                                         #
+    # ------------------------------------------------------------------ #
+    Fcr = _calcular_Fcr_batch(Fe, Fy, Q)
+    Pn  = Fcr * A / 1000     # kN
+    Pd  = PHI_C * Pn         # kN
+
+    return {
+        'familia'      : familia,
+        'modo_pandeo'  : modo_pandeo,
+        'clase_seccion': clasificacion['clase_seccion'],
+        'Fe'           : Fe,
+        'Fcr'          : Fcr,
+        'Pn'           : Pn,
+        'Pd'           : Pd,
+        'Q'            : Q,
+        'Qs'           : Qs,
+        'Qa'           : Qa,
+        'iter_Q'       : iter_Q,
+        'esbeltez_max' : esbeltez_max,
+    }
+
+
 # ============================================================================
 # REPORTE EN CONSOLA
 # ============================================================================
@@ -23,15 +23,8 @@ Unidades internas: mm / N / MPa  →  salida: kN·m
 φb = 0.90 (LRFD)
 """
 
+import math
 import numpy as np
-import sys
-import os
-
-_raiz_python = os.path.normpath(os.path.join(os.path.dirname(__file__), '..'))
-if _raiz_python not in sys.path:
-    sys.path.insert(0, _raiz_python)
-
-from core.utilidades_perfil import extraer_propiedades
 
 
 # ============================================================================
@@ -54,14 +47,14 @@ def _rts(Iy, Cw, Sx):
 
 def _Lp(ry, E, Fy):
     """Longitud límite plástica. F2-5."""
-    return 1.76 * ry * np.sqrt(E / Fy)
+    return 1.76 * ry * math.sqrt(E / Fy)
 
 
 def _Lr(rts, E, Fy, J, Sx, ho):
     """Longitud límite LTB inelástico. F2-6."""
     u = J / (Sx * ho)
-    return 1.95 * rts * (E / (0.7 * Fy)) * np.sqrt(
-        u + np.sqrt(u**2 + 6.76 * (0.7 * Fy / E)**2)
+    return 1.95 * rts * (E / (0.7 * Fy)) * math.sqrt(
+        u + math.sqrt(u**2 + 6.76 * (0.7 * Fy / E)**2)
     )
 
 
@@ -74,7 +67,7 @@ def _Mn_LTB(Lb, Lp, Lr, Mp, Fy, Sx, Cb, E, rts, J, ho):
         return min(Mn, Mp), 'LTB inelástico'
     else:
         slend = Lb / rts
-        Fcr = Cb * np.pi**2 * E / slend**2 * np.sqrt(
+        Fcr = Cb * math.pi**2 * E / slend**2 * math.sqrt(
             1 + 0.078 * J / (Sx * ho) * slend**2
         )
         return min(Fcr * Sx, Mp), 'LTB elástico'
@@ -82,15 +75,15 @@ def _Mn_LTB(Lb, Lp, Lr, Mp, Fy, Sx, Cb, E, rts, J, ho):
 
 def _Mn_FLB(Mp, Fy, Sx, lam_f, E):
     """Mn por FLB. F3. Retorna (Mn, modo, lam_pf, lam_rf)."""
-    lam_pf = 0.38 * np.sqrt(E / Fy)
-    lam_rf = 1.0  * np.sqrt(E / Fy)
+    lam_pf = 0.38 * math.sqrt(E / Fy)
+    lam_rf = 1.0  * math.sqrt(E / Fy)
     if lam_f <= lam_pf:
         return Mp, 'Ala compacta', lam_pf, lam_rf
     elif lam_f <= lam_rf:
         Mn = Mp - (Mp - 0.7 * Fy * Sx) * (lam_f - lam_pf) / (lam_rf - lam_pf)
         return Mn, 'FLB inelástico', lam_pf, lam_rf
     else:
-        Kc  = min(max(4.0 / np.sqrt(lam_f), 0.35), 0.76)
+        Kc  = min(max(4.0 / math.sqrt(lam_f), 0.35), 0.76)
         Fcr = 0.9 * E * Kc / lam_f**2
         return min(Fcr * Sx, Mp), 'FLB elástico', lam_pf, lam_rf
 
@@ -107,8 +100,8 @@ def _Mn_eje_debil(Fy, Sy, Zy, bf_2tf, E):
     My = Fy * Sy
     Mp = Fy * Zy if Zy > 0 else 1.12 * My
     
-    lam_pf = 0.38 * np.sqrt(E / Fy)
-    lam_rf = 1.0  * np.sqrt(E / Fy)
+    lam_pf = 0.38 * math.sqrt(E / Fy)
+    lam_rf = 1.0  * math.sqrt(E / Fy)
     
     if bf_2tf <= lam_pf:
         return Mp, 'Compacta', lam_pf, lam_rf
@@ -129,8 +122,8 @@ def _Mn_perfil_T(Fy, Sx, Zx, d_tw, E):
     My = Fy * Sx
     Mp = Fy * Zx if Zx > 0 else 1.5 * My
     
-    lam_p = 0.84 * np.sqrt(E / Fy)
-    lam_r = 1.03 * np.sqrt(E / Fy)
+    lam_p = 0.84 * math.sqrt(E / Fy)
+    lam_r = 1.03 * math.sqrt(E / Fy)
     
     if d_tw <= lam_p:
         return Mp, 'Stem compacto', lam_p, lam_r
@@ -160,12 +153,12 @@ def _Mn_HSS_rectangular(Fy, Sx, Zx, b_t, h_t, E, eje='fuerte'):
     Mp = Fy * Zx if Zx > 0 else 1.12 * My
     
     # Límites para flanges (perpendicular al eje de flexión)
-    lam_pf = 1.12 * np.sqrt(E / Fy)
-    lam_rf = 1.40 * np.sqrt(E / Fy)
+    lam_pf = 1.12 * math.sqrt(E / Fy)
+    lam_rf = 1.40 * math.sqrt(E / Fy)
     
     # Límites para webs (paralelo al eje de flexión)
-    lam_pw = 2.42 * np.sqrt(E / Fy)
-    lam_rw = 5.70 * np.sqrt(E / Fy)
+    lam_pw = 2.42 * math.sqrt(E / Fy)
+    lam_rw = 5.70 * math.sqrt(E / Fy)
     
     # Para eje fuerte: b es flange, h es web
     # Para eje débil: h es flange, b es web
@@ -250,12 +243,10 @@ def flexion(perfil_nombre: str,
     """
 
     # ── 1. Datos ─────────────────────────────────────────────────────────────
-    perfil    = db_manager.obtener_datos_perfil(perfil_nombre, tipo=tipo_perfil)
     bd_nombre = db_manager.nombre_base_activa()
-    tipo      = str(perfil['Tipo']).strip()
-
-    props   = extraer_propiedades(perfil, base_datos=bd_nombre)
-    familia = props['familia']
+    props     = db_manager.obtener_propiedades_perfil(perfil_nombre, tipo=tipo_perfil)
+    tipo      = props['tipo']
+    familia   = props['familia']
 
     advertencias = []
     resultados = {
@@ -317,8 +308,8 @@ def flexion(perfil_nombre: str,
             Mn_flb, modo_flb, lam_pf, lam_rf = _Mn_FLB(Mp, Fy, Sx, bf_2tf, E_ACERO)
         else:
             Mn_flb, modo_flb = Mp, 'Ala compacta (bf/2tf=0)'
-            lam_pf = 0.38 * np.sqrt(E_ACERO / Fy)
-            lam_rf = 1.0  * np.sqrt(E_ACERO / Fy)
+            lam_pf = 0.38 * math.sqrt(E_ACERO / Fy)
+            lam_rf = 1.0  * math.sqrt(E_ACERO / Fy)
             advertencias.append('bf/2tf=0: FLB no verificado (asume ala compacta)')
 
         Mn_x   = min(Mn_ltb, Mn_flb)
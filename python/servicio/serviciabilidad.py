@@ -40,7 +40,7 @@ _raiz_python = os.path.normpath(os.path.join(os.path.dirname(__file__), '..'))
 if _raiz_python not in sys.path:
     sys.path.insert(0, _raiz_python)
 
-from core.utilidades_perfil import extraer_propiedades, verificar_propiedades
+from core.utilidades_perfil import verificar_propiedades
 
 
 # ============================================================================
@@ -162,9 +162,8 @@ def serviciabilidad(perfil_nombre: str,
     )
 
     # ── Propiedades del perfil ───────────────────────────────────────────
-    perfil    = db_manager.obtener_datos_perfil(perfil_nombre, tipo=tipo_perfil)
     bd_nombre = db_manager.nombre_base_activa()
-    props     = extraer_propiedades(perfil, base_datos=bd_nombre)
+    props     = db_manager.obtener_propiedades_perfil(perfil_nombre, tipo=tipo_perfil)
     familia   = props['familia']
     tipo      = props['tipo']
 